@@ -166,6 +166,20 @@ class DashboardWebSocket {
       return;
     }
 
+    // Batched frames are dispatched one by one, as if sent separately
+    if (data.type === 'batch') {
+      (data.data || []).forEach((frame) => this.dispatchMessage(frame));
+      return;
+    }
+
+    this.dispatchMessage(data);
+  }
+
+  /**
+   * Dispatch a parsed message to its listeners
+   * @param {object} data - Parsed message
+   */
+  dispatchMessage(data) {
     // Handle system messages
     if (data.type === 'pong') {
       this.emit('pong', data);
@@ -38,6 +38,10 @@ __author__ = 'GAS Team'
 
 # Import configuration constants
 from .config import (
+    # Configuration object
+    Config,
+    CONFIG,
+
     # Environment variables
     GAS_DIR,
     GAS_NAME,
@@ -45,6 +49,7 @@ from .config import (
     TASK_DIR,
     PORT,
     HOST,
+    WORKERS,
 
     # Timing configuration
     IDLE_THRESHOLD_SECONDS,
@@ -56,6 +61,7 @@ from .config import (
     MAX_CACHE_SIZE,
     MAX_LIVE_EVENTS,
     MAX_CONTENT_LENGTH,
+    BROADCAST_BATCH_SIZE,
 
     # Detection and display
     COMPLETION_MARKERS,
@@ -82,6 +88,7 @@ from .config import (
     get_task_path,
     get_tool_icon,
     get_status_color,
+    scan_completion,
     validate_config,
     get_config_summary,
 )
@@ -139,6 +146,10 @@ __all__ = [
     '__version__',
     '__author__',
 
+    # Configuration - Object
+    'Config',
+    'CONFIG',
+
     # Configuration - Environment
     'GAS_DIR',
     'GAS_NAME',
@@ -146,6 +157,7 @@ __all__ = [
     'TASK_DIR',
     'PORT',
     'HOST',
+    'WORKERS',
 
     # Configuration - Timing
     'IDLE_THRESHOLD_SECONDS',
@@ -157,6 +169,7 @@ __all__ = [
     'MAX_CACHE_SIZE',
     'MAX_LIVE_EVENTS',
     'MAX_CONTENT_LENGTH',
+    'BROADCAST_BATCH_SIZE',
 
     # Configuration - Detection/Display
     'COMPLETION_MARKERS',
@@ -183,6 +196,7 @@ __all__ = [
     'get_task_path',
     'get_tool_icon',
     'get_status_color',
+    'scan_completion',
     'validate_config',
     'get_config_summary',
 
@@ -13,12 +13,72 @@ Environment Variables:
     GAS_MODE: Operating mode (e.g., 'swarm', 'sequential', 'interactive')
     GAS_DASHBOARD_PORT: Server port (default: 8080)
     GAS_DASHBOARD_HOST: Server host (default: 0.0.0.0)
+    GAS_DASHBOARD_WORKERS: Server processes sharing the ports (default: 1)
     TASK_DIR: Directory for task outputs (default: /tmp/claude-1000)
     GAS_LOG_LEVEL: Logging level (default: INFO)
 """
 
+import functools
 import os
-from typing import Dict, List, Any, Optional
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Union
+
+
+# =============================================================================
+# Configuration Object
+# =============================================================================
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    Immutable dashboard configuration, built once at import as CONFIG.
+
+    The module-level constants below mirror these fields for backward
+    compatibility; new code should prefer CONFIG.
+    """
+    # Server
+    port: int = 8080
+    host: str = '0.0.0.0'
+    workers: int = 1  # Processes sharing the ports via SO_REUSEPORT
+
+    # GAS
+    gas_dir: str = '/workspace/project-gas'
+    gas_name: str = 'GAS Project'
+    gas_mode: str = 'swarm'  # 'swarm' or 'sequential'
+    task_dir: str = '/tmp/claude-1000'
+
+    # Timing (in seconds)
+    idle_threshold_seconds: int = 60  # Time before agent is considered idle
+    completion_threshold_seconds: int = 120  # Time before agent is considered complete
+    websocket_ping_interval: int = 30  # Interval for WebSocket keepalive pings
+    file_watch_interval: float = 0.5  # Interval for checking file changes
+
+    # Resource limits
+    max_cache_size: int = 50  # Maximum number of cached entries
+    max_live_events: int = 50  # Maximum number of live events to store
+    max_content_length: int = 300  # Maximum content length for display
+    broadcast_batch_size: int = 50  # Clients sent to before yielding to the event loop
+
+    # Logging
+    log_level: str = 'INFO'
+
+    @classmethod
+    def from_env(cls) -> 'Config':
+        """Build a Config from environment variables, using defaults for the rest."""
+        return cls(
+            port=int(os.getenv('DASHBOARD_PORT', os.getenv('GAS_DASHBOARD_PORT', '8080'))),
+            host=os.getenv('DASHBOARD_HOST', os.getenv('GAS_DASHBOARD_HOST', '0.0.0.0')),
+            workers=int(os.getenv('GAS_DASHBOARD_WORKERS', '1')),
+            gas_dir=os.getenv('GAS_DIR', '/workspace/project-gas'),
+            gas_name=os.getenv('GAS_NAME', 'GAS Project'),
+            gas_mode=os.getenv('GAS_MODE', 'swarm'),
+            task_dir=os.getenv('TASK_DIR', '/tmp/claude-1000'),
+            log_level=os.getenv('GAS_LOG_LEVEL', 'INFO'),
+        )
+
+
+CONFIG: Config = Config.from_env()
 
 
 # =============================================================================
@@ -26,14 +86,15 @@ from typing import Dict, List, Any, Optional
 # =============================================================================
 
 # Server Configuration
-PORT: int = int(os.getenv('DASHBOARD_PORT', os.getenv('GAS_DASHBOARD_PORT', '8080')))
-HOST: str = os.getenv('DASHBOARD_HOST', os.getenv('GAS_DASHBOARD_HOST', '0.0.0.0'))
+PORT: int = CONFIG.port
+HOST: str = CONFIG.host
+WORKERS: int = CONFIG.workers
 
 # GAS Configuration
-GAS_DIR: str = os.getenv('GAS_DIR', '/workspace/project-gas')
-GAS_NAME: str = os.getenv('GAS_NAME', 'GAS Project')
-GAS_MODE: str = os.getenv('GAS_MODE', 'swarm')  # 'swarm' or 'sequential'
-TASK_DIR: str = os.getenv('TASK_DIR', '/tmp/claude-1000')
+GAS_DIR: str = CONFIG.gas_dir
+GAS_NAME: str = CONFIG.gas_name
+GAS_MODE: str = CONFIG.gas_mode
+TASK_DIR: str = CONFIG.task_dir
 
 
 # =============================================================================
@@ -41,23 +102,24 @@ TASK_DIR: str = os.getenv('TASK_DIR', '/tmp/claude-1000')
 # =============================================================================
 
 # Agent activity thresholds
-IDLE_THRESHOLD_SECONDS: int = 60  # Time before agent is considered idle
-COMPLETION_THRESHOLD_SECONDS: int = 120  # Time before agent is considered complete
+IDLE_THRESHOLD_SECONDS: int = CONFIG.idle_threshold_seconds
+COMPLETION_THRESHOLD_SECONDS: int = CONFIG.completion_threshold_seconds
 
 # WebSocket configuration
-WEBSOCKET_PING_INTERVAL: int = 30  # Interval for WebSocket keepalive pings
+WEBSOCKET_PING_INTERVAL: int = CONFIG.websocket_ping_interval
 
 # File watching configuration
-FILE_WATCH_INTERVAL: float = 0.5  # Interval for checking file changes
+FILE_WATCH_INTERVAL: float = CONFIG.file_watch_interval
 
 
 # =============================================================================
 # Resource Limits
 # =============================================================================
 
-MAX_CACHE_SIZE: int = 50  # Maximum number of cached entries
-MAX_LIVE_EVENTS: int = 50  # Maximum number of live events to store
-MAX_CONTENT_LENGTH: int = 300  # Maximum content length for display
+MAX_CACHE_SIZE: int = CONFIG.max_cache_size
+MAX_LIVE_EVENTS: int = CONFIG.max_live_events
+MAX_CONTENT_LENGTH: int = CONFIG.max_content_length
+BROADCAST_BATCH_SIZE: int = CONFIG.broadcast_batch_size
 
 
 # =============================================================================
@@ -85,6 +147,36 @@ COMPLETION_MARKERS: List[str] = [
 ]
 
 
+def _select_marker_grams(markers: List[str], n: int = 4) -> List[str]:
+    """
+    Greedily pick n-grams until every marker contains at least one.
+    Text containing none of the grams cannot contain any marker.
+    """
+    uncovered = list(markers)
+    grams: List[str] = []
+    while uncovered:
+        counts = Counter(
+            gram
+            for marker in uncovered
+            for gram in dict.fromkeys(
+                marker[i:i + n] for i in range(max(1, len(marker) - n + 1))
+            )
+        )
+        gram = counts.most_common(1)[0][0]
+        grams.append(gram)
+        uncovered = [marker for marker in uncovered if gram not in marker]
+    return grams
+
+
+# Markers lowercased once, plus a few 4-grams covering all of them. Most
+# chunks contain none of the grams and are rejected after a handful of
+# C-level substring scans, before any per-marker test.
+_COMPLETION_MARKERS_LC: List[str] = [m.lower() for m in COMPLETION_MARKERS]
+_COMPLETION_MARKERS_LC_BYTES: List[bytes] = [m.encode('utf-8') for m in _COMPLETION_MARKERS_LC]
+_COMPLETION_GRAMS: List[str] = _select_marker_grams(_COMPLETION_MARKERS_LC)
+_COMPLETION_GRAMS_BYTES: List[bytes] = [g.encode('utf-8') for g in _COMPLETION_GRAMS]
+
+
 # =============================================================================
 # Tool Icons for UI
 # =============================================================================
@@ -115,6 +207,8 @@ TOOL_ICONS: Dict[str, str] = {
     'default': 'tool',
 }
 
+_TOOL_ICON_DEFAULT: str = TOOL_ICONS['default']
+
 
 # =============================================================================
 # Status Colors (for UI rendering)
@@ -138,6 +232,10 @@ STATUS_COLORS: Dict[str, str] = {
     'timeout': '#D4A76A',       # Gold - tool timed out
 }
 
+# Lowercased lookup table and fallback, built once for get_status_color()
+_STATUS_COLORS_LC: Dict[str, str] = {k.lower(): v for k, v in STATUS_COLORS.items()}
+_STATUS_COLOR_DEFAULT: str = STATUS_COLORS['pending']
+
 
 # =============================================================================
 # WebSocket Message Types
@@ -188,7 +286,7 @@ IGNORE_PATTERNS: List[str] = [
 
 LOG_FORMAT: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 LOG_DATE_FORMAT: str = '%Y-%m-%d %H:%M:%S'
-LOG_LEVEL: str = os.getenv('GAS_LOG_LEVEL', 'INFO')
+LOG_LEVEL: str = CONFIG.log_level
 
 
 # =============================================================================
@@ -203,6 +301,10 @@ API_PREFIX: str = f'/api/{API_VERSION}'
 # Helper Functions
 # =============================================================================
 
+# Path helpers are pure functions of immutable settings, so results are
+# memoized (bounded, to cap memory for callers passing many unique paths).
+
+@functools.lru_cache(maxsize=1024)
 def get_gas_path(*parts: str) -> str:
     """
     Construct a path relative to GAS_DIR.
@@ -216,6 +318,7 @@ def get_gas_path(*parts: str) -> str:
     return os.path.join(GAS_DIR, *parts)
 
 
+@functools.lru_cache(maxsize=1024)
 def get_session_path(*parts: str) -> str:
     """
     Construct a path relative to the current GAS session.
@@ -229,6 +332,7 @@ def get_session_path(*parts: str) -> str:
     return os.path.join(GAS_DIR, GAS_NAME, *parts)
 
 
+@functools.lru_cache(maxsize=1024)
 def get_task_path(*parts: str) -> str:
     """
     Construct a path relative to TASK_DIR.
@@ -252,7 +356,7 @@ def get_tool_icon(tool_name: str) -> str:
     Returns:
         Icon string for the tool
     """
-    return TOOL_ICONS.get(tool_name, TOOL_ICONS.get('default', 'tool'))
+    return TOOL_ICONS.get(tool_name, _TOOL_ICON_DEFAULT)
 
 
 def get_status_color(status: str) -> str:
@@ -260,12 +364,44 @@ def get_status_color(status: str) -> str:
     Get the color for a given status.
 
     Args:
-        status: Status string
+        status: Status string; lowercase input skips case folding
 
     Returns:
         Hex color code for the status
     """
-    return STATUS_COLORS.get(status.lower(), STATUS_COLORS.get('pending', '#9B8B7A'))
+    color = _STATUS_COLORS_LC.get(status)
+    if color is None:
+        color = _STATUS_COLORS_LC.get(status.lower(), _STATUS_COLOR_DEFAULT)
+    return color
+
+
+def scan_completion(text: Union[str, bytes]) -> Optional[int]:
+    """
+    Scan text for completion markers, case-insensitively.
+
+    The text is lowercased once and checked against the covering grams
+    first; markers are only tested individually if a gram is present.
+
+    Args:
+        text: Text or raw bytes to scan
+
+    Returns:
+        Index into COMPLETION_MARKERS of the first marker found, or None
+    """
+    if isinstance(text, str):
+        grams, markers = _COMPLETION_GRAMS, _COMPLETION_MARKERS_LC
+    else:
+        grams, markers = _COMPLETION_GRAMS_BYTES, _COMPLETION_MARKERS_LC_BYTES
+        text = bytes(text)
+
+    lowered = text.lower()
+    if not any(gram in lowered for gram in grams):
+        return None
+
+    for index, marker in enumerate(markers):
+        if marker in lowered:
+            return index
+    return None
 
 
 # =============================================================================
@@ -276,6 +412,8 @@ def validate_config() -> Dict[str, Any]:
     """
     Validate the current configuration and return a status report.
 
+    Not cached: directory checks reflect the filesystem at call time.
+
     Returns:
         Dictionary with validation results
     """
@@ -283,34 +421,37 @@ def validate_config() -> Dict[str, Any]:
     warnings: List[str] = []
 
     # Check GAS_DIR exists or can be created
-    if not os.path.exists(GAS_DIR):
-        warnings.append(f'GAS_DIR does not exist: {GAS_DIR}')
+    if not os.path.exists(CONFIG.gas_dir):
+        warnings.append(f'GAS_DIR does not exist: {CONFIG.gas_dir}')
 
     # Check TASK_DIR exists
-    if not os.path.exists(TASK_DIR):
-        warnings.append(f'TASK_DIR does not exist: {TASK_DIR}')
+    if not os.path.exists(CONFIG.task_dir):
+        warnings.append(f'TASK_DIR does not exist: {CONFIG.task_dir}')
+
+    if CONFIG.workers < 1:
+        issues.append('GAS_DASHBOARD_WORKERS must be at least 1')
 
     # Validate timing settings
-    if IDLE_THRESHOLD_SECONDS <= 0:
+    if CONFIG.idle_threshold_seconds <= 0:
         issues.append('IDLE_THRESHOLD_SECONDS must be positive')
 
-    if COMPLETION_THRESHOLD_SECONDS <= IDLE_THRESHOLD_SECONDS:
+    if CONFIG.completion_threshold_seconds <= CONFIG.idle_threshold_seconds:
         warnings.append('COMPLETION_THRESHOLD_SECONDS should be greater than IDLE_THRESHOLD_SECONDS')
 
-    if FILE_WATCH_INTERVAL <= 0:
+    if CONFIG.file_watch_interval <= 0:
         issues.append('FILE_WATCH_INTERVAL must be positive')
 
-    if WEBSOCKET_PING_INTERVAL <= 0:
+    if CONFIG.websocket_ping_interval <= 0:
         issues.append('WEBSOCKET_PING_INTERVAL must be positive')
 
     # Validate resource limits
-    if MAX_CACHE_SIZE <= 0:
+    if CONFIG.max_cache_size <= 0:
         issues.append('MAX_CACHE_SIZE must be positive')
 
-    if MAX_LIVE_EVENTS <= 0:
+    if CONFIG.max_live_events <= 0:
         issues.append('MAX_LIVE_EVENTS must be positive')
 
-    if MAX_CONTENT_LENGTH <= 0:
+    if CONFIG.max_content_length <= 0:
         issues.append('MAX_CONTENT_LENGTH must be positive')
 
     return {
@@ -318,12 +459,13 @@ def validate_config() -> Dict[str, Any]:
         'issues': issues,
         'warnings': warnings,
         'config': {
-            'GAS_DIR': GAS_DIR,
-            'GAS_NAME': GAS_NAME,
-            'GAS_MODE': GAS_MODE,
-            'TASK_DIR': TASK_DIR,
-            'PORT': PORT,
-            'HOST': HOST,
+            'GAS_DIR': CONFIG.gas_dir,
+            'GAS_NAME': CONFIG.gas_name,
+            'GAS_MODE': CONFIG.gas_mode,
+            'TASK_DIR': CONFIG.task_dir,
+            'PORT': CONFIG.port,
+            'HOST': CONFIG.host,
+            'WORKERS': CONFIG.workers,
         }
     }
 
@@ -337,29 +479,30 @@ def get_config_summary() -> Dict[str, Any]:
     """
     return {
         'server': {
-            'port': PORT,
-            'host': HOST,
+            'port': CONFIG.port,
+            'host': CONFIG.host,
+            'workers': CONFIG.workers,
             'api_prefix': API_PREFIX,
         },
         'gas': {
-            'dir': GAS_DIR,
-            'name': GAS_NAME,
-            'mode': GAS_MODE,
-            'task_dir': TASK_DIR,
+            'dir': CONFIG.gas_dir,
+            'name': CONFIG.gas_name,
+            'mode': CONFIG.gas_mode,
+            'task_dir': CONFIG.task_dir,
         },
         'timing': {
-            'idle_threshold': IDLE_THRESHOLD_SECONDS,
-            'completion_threshold': COMPLETION_THRESHOLD_SECONDS,
-            'websocket_ping': WEBSOCKET_PING_INTERVAL,
-            'file_watch': FILE_WATCH_INTERVAL,
+            'idle_threshold': CONFIG.idle_threshold_seconds,
+            'completion_threshold': CONFIG.completion_threshold_seconds,
+            'websocket_ping': CONFIG.websocket_ping_interval,
+            'file_watch': CONFIG.file_watch_interval,
         },
         'limits': {
-            'max_cache': MAX_CACHE_SIZE,
-            'max_events': MAX_LIVE_EVENTS,
-            'max_content': MAX_CONTENT_LENGTH,
+            'max_cache': CONFIG.max_cache_size,
+            'max_events': CONFIG.max_live_events,
+            'max_content': CONFIG.max_content_length,
         },
         'logging': {
-            'level': LOG_LEVEL,
+            'level': CONFIG.log_level,
             'format': LOG_FORMAT,
         }
     }
@@ -2,97 +2,289 @@
 """
 File Position Tracker
 =====================
-Efficient incremental file reading using seek/tell for real-time streaming.
+Efficient incremental file reading using memory-mapped tailing for real-time streaming.
 Provides memory-efficient tracking of multiple files for the GAS dashboard.
 """
 
+import asyncio
+import mmap
 import os
 import threading
+import time
 import logging
-from typing import Dict, Optional, List, Tuple
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, List, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime
+
+try:
+    import xxhash
+    _hash_bytes = xxhash.xxh3_64_intdigest
+except ImportError:
+    _hash_bytes = zlib.crc32
 
 logger = logging.getLogger(__name__)
 
+# Bytes from the start of a file used to fingerprint its content
+CONTENT_HASH_BYTES = 4096
+
+
+def read_file_head(file_path: str, length: int = CONTENT_HASH_BYTES) -> Tuple[int, bytes]:
+    """
+    Read the size and first bytes of a file for content fingerprinting.
+    Returns (size, head_bytes).
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        return size, f.read(length)
+
 
-@dataclass
+@dataclass(slots=True)
 class FileState:
     """Track state for a single file."""
     path: str
     position: int = 0
     last_modified: float = 0.0
     last_size: int = 0
-    last_read: Optional[datetime] = None
+    last_read: float = 0.0  # Epoch seconds, 0.0 if never read
     error_count: int = 0
     line_count: int = 0
+    fd: int = -1
+    inode: int = 0
+    mmap_obj: Optional[mmap.mmap] = None
+    mmap_size: int = 0
 
 
 class FilePositionTracker:
     """
     Track file positions for incremental reading.
     Memory-efficient: only stores position, not content.
-    Thread-safe with internal locking.
+    Thread-safe with internal locking: files are spread over NUM_BUCKETS
+    buckets, each with its own lock, so reads of unrelated files don't
+    contend.
     """
 
+    NUM_BUCKETS = 16  # Must be a power of two
+
     def __init__(self, max_files: int = 100):
-        self._files: Dict[str, FileState] = {}
-        self._lock = threading.Lock()
+        # Each bucket keeps LRU order: least recently used first
+        self._buckets: List['OrderedDict[str, FileState]'] = [
+            OrderedDict() for _ in range(self.NUM_BUCKETS)
+        ]
+        self._locks = [threading.Lock() for _ in range(self.NUM_BUCKETS)]
         self._max_files = max_files
+        # Files tracked across all buckets. Paths don't hash evenly, so the
+        # limit is global: eviction starts only once the whole tracker is full
+        self._count = 0
+        self._count_lock = threading.Lock()
+
+    def _bucket(self, file_path: str) -> int:
+        """Return the bucket index for a file path."""
+        return hash(file_path) & (self.NUM_BUCKETS - 1)
+
+    @contextmanager
+    def _all_locks(self) -> Iterator[None]:
+        """Acquire every bucket lock, always in the same order."""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
 
-    def get_new_content(self, file_path: str) -> Tuple[str, bool]:
+    def get_new_content(self, file_path: str) -> Tuple[bytes, bool]:
         """
-        Read new content from file since last read using seek/tell.
-        Returns (new_content, has_new_content).
+        Read new content from file since last read.
+        Returns (new_content, has_new_content) with new_content as raw bytes;
+        callers decode if they need text.
 
-        Uses efficient seek/tell to avoid re-reading entire files.
+        Slices a memory map of the file held across polls, so only the
+        appended bytes are paged in and there is no per-poll open/close.
         """
-        with self._lock:
-            if not os.path.exists(file_path):
-                return '', False
+        stat = self._stat(file_path)
+        bucket = self._bucket(file_path)
+        with self._locks[bucket]:
+            return self._read_new_locked(self._buckets[bucket], file_path, stat)
+
+    def get_new_content_batch(self, file_paths: List[str]) -> Dict[str, Tuple[bytes, bool]]:
+        """
+        Read new content from several files in one pass.
+        Returns {file_path: (new_content, has_new_content)}.
+
+        All paths are stat'ed up front, then only the changed files are read,
+        taking each bucket lock once instead of once per file.
+        """
+        stats = self._stat_many(file_paths)
 
+        results: Dict[str, Tuple[bytes, bool]] = {}
+        for bucket, paths in self._group_by_bucket(file_paths).items():
+            results.update(self._read_bucket(bucket, paths, stats))
+        return results
+
+    async def get_new_content_batch_async(self, file_paths: List[str]) -> Dict[str, Tuple[bytes, bool]]:
+        """
+        Async variant of get_new_content_batch() for event-loop callers.
+        The stat and read syscalls run in worker threads so they never
+        block the loop; the bucket locks keep this safe alongside
+        synchronous callers on the loop thread.
+
+        After one threaded stat pass, each bucket is read in its own worker
+        thread and the reads are gathered, so the kernel can overlap I/O on
+        different files instead of serving them one after another.
+        """
+        stats = await asyncio.to_thread(self._stat_many, file_paths)
+        by_bucket = self._group_by_bucket(file_paths)
+
+        parts = await asyncio.gather(*(
+            asyncio.to_thread(self._read_bucket, bucket, paths, stats)
+            for bucket, paths in by_bucket.items()
+        ))
+
+        results: Dict[str, Tuple[bytes, bool]] = {}
+        for part in parts:
+            results.update(part)
+        return results
+
+    def _group_by_bucket(self, file_paths: List[str]) -> Dict[int, List[str]]:
+        """Group file paths by bucket index, preserving order within a bucket."""
+        by_bucket: Dict[int, List[str]] = {}
+        for file_path in file_paths:
+            by_bucket.setdefault(self._bucket(file_path), []).append(file_path)
+        return by_bucket
+
+    def _read_bucket(
+        self,
+        bucket: int,
+        file_paths: List[str],
+        stats: Dict[str, Optional[os.stat_result]]
+    ) -> Dict[str, Tuple[bytes, bool]]:
+        """Read new content for files sharing a bucket under one lock acquisition."""
+        files = self._buckets[bucket]
+        with self._locks[bucket]:
+            return {
+                file_path: self._read_new_locked(files, file_path, stats[file_path])
+                for file_path in file_paths
+            }
+
+    @staticmethod
+    def _stat(file_path: str) -> Optional[os.stat_result]:
+        """Stat a file, returning None if it does not exist."""
+        try:
+            return os.stat(file_path)
+        except OSError:
+            return None
+
+    @classmethod
+    def _stat_many(cls, file_paths: List[str]) -> Dict[str, Optional[os.stat_result]]:
+        """
+        Stat several files, returning None for files that do not exist.
+
+        Files sharing a directory are stat'ed through one os.scandir() pass
+        of that directory instead of a separate path lookup per file.
+        """
+        by_dir: Dict[str, List[str]] = {}
+        for file_path in file_paths:
+            by_dir.setdefault(os.path.dirname(file_path), []).append(file_path)
+
+        stats: Dict[str, Optional[os.stat_result]] = {}
+        for parent, paths in by_dir.items():
+            if len(paths) == 1:
+                stats[paths[0]] = cls._stat(paths[0])
+                continue
+
+            wanted = {os.path.basename(path): path for path in paths}
             try:
-                stat = os.stat(file_path)
-                current_size = stat.st_size
-                current_mtime = stat.st_mtime
-
-                # Get or create file state
-                if file_path not in self._files:
-                    self._ensure_capacity()
-                    self._files[file_path] = FileState(path=file_path)
-
-                state = self._files[file_path]
-
-                # Check if file has new content (same mtime and size = no change)
-                if current_mtime == state.last_modified and current_size == state.last_size:
-                    return '', False
-
-                # Handle file truncation (e.g., log rotation)
-                if current_size < state.last_size:
-                    state.position = 0
-                    state.line_count = 0
-                    logger.debug(f"File truncated, resetting position: {file_path}")
-
-                # Read new content using seek
-                with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                    f.seek(state.position)
-                    new_content = f.read()
-                    state.position = f.tell()
-
-                # Update state
-                state.last_modified = current_mtime
-                state.last_size = current_size
-                state.last_read = datetime.utcnow()
-                state.error_count = 0
-                state.line_count += new_content.count('\n')
-
-                return new_content, bool(new_content)
-
-            except Exception as e:
-                if file_path in self._files:
-                    self._files[file_path].error_count += 1
-                logger.error(f"Error reading {file_path}: {e}")
-                return '', False
+                with os.scandir(parent or '.') as entries:
+                    for entry in entries:
+                        path = wanted.get(entry.name)
+                        if path is not None:
+                            try:
+                                stats[path] = entry.stat()
+                            except OSError:
+                                stats[path] = None
+            except OSError:
+                pass
+
+            for path in paths:
+                stats.setdefault(path, None)
+
+        return stats
+
+    def _read_new_locked(
+        self,
+        files: 'OrderedDict[str, FileState]',
+        file_path: str,
+        stat: Optional[os.stat_result]
+    ) -> Tuple[bytes, bool]:
+        """Read content appended since the last read. Caller must hold the bucket lock."""
+        if stat is None:
+            return b'', False
+
+        try:
+            current_size = stat.st_size
+            current_mtime = stat.st_mtime
+
+            # Get or create file state
+            if file_path not in files:
+                self._ensure_capacity(files)
+                files[file_path] = FileState(path=file_path)
+            else:
+                files.move_to_end(file_path)
+
+            state = files[file_path]
+
+            # Check if file has new content (same mtime and size = no change)
+            if current_mtime == state.last_modified and current_size == state.last_size:
+                return b'', False
+
+            # Handle file truncation (e.g., log rotation)
+            if current_size < state.last_size:
+                self._unmap(state)
+                state.position = 0
+                state.line_count = 0
+                logger.debug(f"File truncated, resetting position: {file_path}")
+
+            # Handle file replacement (e.g., rotation by rename)
+            if state.fd >= 0 and state.inode != stat.st_ino:
+                self._close_fd(state)
+                state.position = 0
+                state.line_count = 0
+                logger.debug(f"File replaced, reopening: {file_path}")
+
+            if state.fd < 0:
+                state.fd = os.open(file_path, os.O_RDONLY)
+                state.inode = os.fstat(state.fd).st_ino
+
+            # Re-check size on the open descriptor: touching mapped pages past
+            # EOF after a concurrent truncation would fault the process.
+            end = min(current_size, os.fstat(state.fd).st_size)
+
+            # Remap only when the file grew past the current mapping
+            if end > state.mmap_size:
+                self._unmap(state)
+                state.mmap_obj = mmap.mmap(state.fd, end, access=mmap.ACCESS_READ)
+                state.mmap_size = end
+
+            # Slice only the bytes appended since the last position
+            new_content = state.mmap_obj[state.position:end] if end > state.position else b''
+            state.position += len(new_content)
+
+            # Update state
+            state.last_modified = current_mtime
+            state.last_size = current_size
+            state.last_read = time.time()
+            state.error_count = 0
+            state.line_count += new_content.count(b'\n')
+
+            return new_content, bool(new_content)
+
+        except Exception as e:
+            if file_path in files:
+                files[file_path].error_count += 1
+            logger.error(f"Error reading {file_path}: {e}")
+            return b'', False
 
     def get_all_content(self, file_path: str) -> str:
         """Read entire file content (for initial load)."""
@@ -103,12 +295,16 @@ class FilePositionTracker:
                 content = f.read()
 
             # Update position to end
-            with self._lock:
-                if file_path not in self._files:
-                    self._ensure_capacity()
-                    self._files[file_path] = FileState(path=file_path)
-                self._files[file_path].position = len(content.encode('utf-8'))
-                self._files[file_path].last_read = datetime.utcnow()
+            bucket = self._bucket(file_path)
+            files = self._buckets[bucket]
+            with self._locks[bucket]:
+                if file_path not in files:
+                    self._ensure_capacity(files)
+                    files[file_path] = FileState(path=file_path)
+                else:
+                    files.move_to_end(file_path)
+                files[file_path].position = len(content.encode('utf-8'))
+                files[file_path].last_read = time.time()
 
             return content
         except Exception:
@@ -116,42 +312,105 @@ class FilePositionTracker:
 
     def reset_position(self, file_path: str) -> None:
         """Reset file position to start."""
-        with self._lock:
-            if file_path in self._files:
-                self._files[file_path].position = 0
+        bucket = self._bucket(file_path)
+        with self._locks[bucket]:
+            state = self._buckets[bucket].get(file_path)
+            if state is not None:
+                state.position = 0
+
+    def position(self, file_path: str) -> Optional[int]:
+        """Return the tracked read position for a file, or None if untracked."""
+        bucket = self._bucket(file_path)
+        with self._locks[bucket]:
+            state = self._buckets[bucket].get(file_path)
+            return state.position if state is not None else None
 
     def get_file_info(self, file_path: str) -> Optional[FileState]:
         """Get tracking info for a file."""
-        with self._lock:
-            return self._files.get(file_path)
-
-    def _ensure_capacity(self) -> None:
-        """Ensure we don't exceed max files by removing oldest."""
-        if len(self._files) >= self._max_files:
-            # Remove oldest by last_read
-            oldest = min(
-                self._files.items(),
-                key=lambda x: x[1].last_read or datetime.min
-            )
-            del self._files[oldest[0]]
+        bucket = self._bucket(file_path)
+        with self._locks[bucket]:
+            files = self._buckets[bucket]
+            state = files.get(file_path)
+            if state is not None:
+                files.move_to_end(file_path)
+            return state
+
+    def _ensure_capacity(self, files: 'OrderedDict[str, FileState]') -> None:
+        """
+        Make room for one more file in a bucket. Caller must hold its lock.
+
+        Below max_files this only counts the new file. At the limit, the
+        least recently used file of the caller's bucket is evicted, or, if
+        that bucket is empty, one from any bucket whose lock is free.
+        """
+        with self._count_lock:
+            if self._count < self._max_files:
+                self._count += 1
+                return
+
+        if files:
+            _, state = files.popitem(last=False)
+            self._close_fd(state)
+            return
+
+        # Never block on another bucket: its holder may be waiting for ours
+        for lock, other in zip(self._locks, self._buckets):
+            if other and lock.acquire(blocking=False):
+                try:
+                    if other:
+                        _, state = other.popitem(last=False)
+                        self._close_fd(state)
+                        return
+                finally:
+                    lock.release()
+
+        # Every other bucket is busy; go one over the limit instead
+        with self._count_lock:
+            self._count += 1
+
+    @staticmethod
+    def _unmap(state: FileState) -> None:
+        """Release the memory map for a file, if any."""
+        if state.mmap_obj is not None:
+            state.mmap_obj.close()
+            state.mmap_obj = None
+        state.mmap_size = 0
+
+    @classmethod
+    def _close_fd(cls, state: FileState) -> None:
+        """Release the memory map and cached descriptor for a file, if any."""
+        cls._unmap(state)
+        if state.fd >= 0:
+            try:
+                os.close(state.fd)
+            except OSError:
+                pass
+            state.fd = -1
 
     def clear(self) -> None:
         """Clear all tracked files."""
-        with self._lock:
-            self._files.clear()
+        with self._all_locks():
+            for files in self._buckets:
+                for state in files.values():
+                    self._close_fd(state)
+                files.clear()
+            with self._count_lock:
+                self._count = 0
 
     @property
     def tracked_count(self) -> int:
         """Return count of tracked files."""
-        with self._lock:
-            return len(self._files)
+        with self._all_locks():
+            return sum(len(files) for files in self._buckets)
 
     def get_stats(self) -> Dict[str, int]:
         """Get tracking statistics."""
-        with self._lock:
-            total_errors = sum(s.error_count for s in self._files.values())
+        with self._all_locks():
+            total_errors = sum(
+                s.error_count for files in self._buckets for s in files.values()
+            )
             return {
-                'tracked_files': len(self._files),
+                'tracked_files': sum(len(files) for files in self._buckets),
                 'max_files': self._max_files,
                 'total_errors': total_errors
             }
@@ -166,71 +425,127 @@ class BoundedParseCache:
     Cache keys can be:
     - Simple string keys: cache.get('key')
     - Composite keys with mtime: cache.get_with_mtime('filepath', mtime)
+    - Content keys: cache.get_with_content_hash('filepath', size, head_bytes)
+    - Position keys: cache.get_with_position('filepath', tracked_position)
+
+    The newest entry set through any per-file key is also available from
+    cache.get_latest('filepath') without knowing its key.
+
+    Values are stored as-is, so parsed objects can be cached without
+    decomposing them into dicts.
     """
 
     def __init__(self, max_size: int = 50):
-        self._cache: Dict[str, dict] = {}
-        self._access_order: List[str] = []
+        # OrderedDict keeps LRU order: oldest first, most recently used last
+        self._cache: 'OrderedDict[str, Any]' = OrderedDict()
+        # Key of the most recently set entry for each file path
+        self._latest_key: Dict[str, str] = {}
         self._lock = threading.Lock()
         self._max_size = max_size
         self._hits = 0
         self._misses = 0
 
-    def get(self, key: str) -> Optional[dict]:
+    def get(self, key: str) -> Optional[Any]:
         """Get cached parse result by key."""
         with self._lock:
-            if key in self._cache:
+            value = self._cache.get(key)
+            if value is not None:
                 # Move to end (most recently used)
-                self._access_order.remove(key)
-                self._access_order.append(key)
+                self._cache.move_to_end(key)
                 self._hits += 1
-                return self._cache[key]
+                return value
             self._misses += 1
             return None
 
-    def get_with_mtime(self, filepath: str, mtime: float) -> Optional[dict]:
+    def get_with_mtime(self, filepath: str, mtime: float) -> Optional[Any]:
         """Get cached result using filepath and mtime as composite key."""
         key = f"{filepath}:{mtime}"
         return self.get(key)
 
-    def set(self, key: str, value: dict) -> None:
+    def set(self, key: str, value: Any) -> None:
         """Cache a parse result."""
         with self._lock:
             if key in self._cache:
-                self._access_order.remove(key)
+                self._cache.move_to_end(key)
             elif len(self._cache) >= self._max_size:
                 # Remove least recently used
-                oldest = self._access_order.pop(0)
-                del self._cache[oldest]
+                self._cache.popitem(last=False)
 
             self._cache[key] = value
-            self._access_order.append(key)
 
-    def set_with_mtime(self, filepath: str, mtime: float, value: dict) -> None:
-        """Cache result using filepath and mtime as composite key."""
-        key = f"{filepath}:{mtime}"
+    def _set_for_file(self, filepath: str, key: str, value: Any) -> None:
+        """Cache a per-file result and remember it as the file's latest."""
         self.set(key, value)
+        with self._lock:
+            self._latest_key[filepath] = key
+
+    def get_latest(self, filepath: str) -> Optional[Any]:
+        """Get the most recently cached result for a file, whatever its key."""
+        with self._lock:
+            key = self._latest_key.get(filepath)
+            if key is None:
+                self._misses += 1
+                return None
+            value = self._cache.get(key)
+            if value is None:
+                # Evicted since it was set
+                del self._latest_key[filepath]
+                self._misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set_with_mtime(self, filepath: str, mtime: float, value: Any) -> None:
+        """Cache result using filepath and mtime as composite key."""
+        self._set_for_file(filepath, f"{filepath}:{mtime}", value)
+
+    @staticmethod
+    def _content_key(filepath: str, size: int, buf: bytes) -> str:
+        """Build a cache key from file size and a hash of its first bytes."""
+        fingerprint = _hash_bytes(buf[:CONTENT_HASH_BYTES]) ^ (size << 1)
+        return f"{filepath}:{size}:{fingerprint:x}"
+
+    def get_with_content_hash(self, filepath: str, size: int, buf: bytes) -> Optional[Any]:
+        """
+        Get cached result keyed on file content rather than mtime.
+        A touch or atomic rewrite with identical content still hits.
+        """
+        return self.get(self._content_key(filepath, size, buf))
+
+    def set_with_content_hash(self, filepath: str, size: int, buf: bytes, value: Any) -> None:
+        """Cache result keyed on file size and a hash of its first bytes."""
+        self._set_for_file(filepath, self._content_key(filepath, size, buf), value)
+
+    def get_with_position(self, filepath: str, position: int) -> Optional[Any]:
+        """
+        Get cached result keyed on the tracker's read position.
+        The position only moves when new bytes are read, so no stat is needed.
+        """
+        return self.get(f"{filepath}:@{position}")
+
+    def set_with_position(self, filepath: str, position: int, value: Any) -> None:
+        """Cache result using filepath and tracked read position as composite key."""
+        self._set_for_file(filepath, f"{filepath}:@{position}", value)
 
     def invalidate(self, key: str) -> None:
         """Remove a key from cache."""
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                self._access_order.remove(key)
+            self._cache.pop(key, None)
 
     def invalidate_file(self, filepath: str) -> None:
         """Invalidate all cache entries for a specific file."""
+        prefix = f"{filepath}:"
         with self._lock:
-            keys_to_remove = [k for k in self._cache.keys() if k.startswith(f"{filepath}:")]
-            for key in keys_to_remove:
+            for key in [k for k in self._cache if k.startswith(prefix)]:
                 del self._cache[key]
-                self._access_order.remove(key)
+            self._latest_key.pop(filepath, None)
 
     def clear(self) -> None:
         """Clear entire cache."""
         with self._lock:
             self._cache.clear()
-            self._access_order.clear()
+            self._latest_key.clear()
             self._hits = 0
             self._misses = 0
 
@@ -8,12 +8,20 @@ Reads gas-state.json, knowledge stores, and agent output files.
 import asyncio
 import json
 import os
-import glob
-from datetime import datetime, timezone
-from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+import re
+import time
+from collections import Counter, defaultdict, deque
+from datetime import datetime
+from operator import itemgetter
+from typing import Any, Callable, DefaultDict, Deque, Dict, List, Optional, Set, Tuple
 import logging
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from .config import (
     GAS_DIR,
     GAS_NAME,
@@ -29,12 +37,28 @@ from .output_parser import parse_output_content, ParsedOutput
 
 logger = logging.getLogger(__name__)
 
+# First path component that is a short agent ID (``a`` plus six
+# alphanumerics) or mentions "agent" in any case
+_AGENT_ID_RE = re.compile(r'(?:^|/)(a[A-Za-z0-9]{6}|[^/]*(?i:agent)[^/]*)(?=/|$)')
+
+# Sort key for generation events
+_GENERATION_ORDER = itemgetter('generation', 'agent_id')
+
+# Per-wave status counters that are always present, even when zero
+_WAVE_STATUS_ZEROS = {'running': 0, 'completed': 0, 'idle': 0, 'pending': 0}
+
 
 class GASStatusGatherer:
     """
     Gather status from GAS project state and agent outputs.
     """
 
+    # Seconds a gathered agents dict is reused when no changes were seen
+    AGENTS_CACHE_TTL = 0.5
+    # Seconds a full status is reused when no changes were seen; bounds how
+    # late time-based transitions (running -> idle) show up
+    FULL_STATUS_MAX_AGE = 5.0
+
     def __init__(
         self,
         gas_dir: Optional[str] = None,
@@ -48,11 +72,29 @@ class GASStatusGatherer:
         self._parse_cache = BoundedParseCache(max_size=50)
 
         # State tracking
-        self._last_state_hash: str = ''
+        # (path, size, mtime_ns) of the last parsed state/knowledge files
+        self._last_state_key: Optional[Tuple[str, int, int]] = None
+        self._gas_state: Dict[str, Any] = {}
+        self._last_knowledge_key: Optional[Tuple[str, int, int]] = None
+        self._knowledge: List[Dict[str, Any]] = []
         self._last_check: Optional[datetime] = None
         self._agent_parsed: Dict[str, ParsedOutput] = {}
-        self._recent_events: List[Dict[str, Any]] = []
-        self._new_events: List[Dict[str, Any]] = []
+        # Output files check_for_changes saw grow since the last gather
+        self._dirty_files: Set[str] = set()
+        self._recent_events: Deque[Dict[str, Any]] = deque(maxlen=MAX_LIVE_EVENTS)
+        self._new_events: Deque[Dict[str, Any]] = deque()
+
+        # Output file discovery cache, invalidated by walked directory mtimes
+        self._glob_cache: Optional[List[str]] = None
+        self._glob_dir_mtimes: Tuple[Tuple[str, int], ...] = ()
+
+        # Last gathered agents dict, dropped when check_for_changes sees changes
+        self._agents_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._agents_cache_ts: float = 0.0
+
+        # Last full status, dropped when check_for_changes sees changes
+        self._full_status_cache: Optional[Dict[str, Any]] = None
+        self._full_status_ts: float = 0.0
 
         # GAS-specific paths
         self._gas_state_path = os.path.join(self.gas_dir, 'gas-state.json')
@@ -63,7 +105,14 @@ class GASStatusGatherer:
         """
         Get full dashboard status including all agents.
         """
-        now = datetime.utcnow()
+        now_iso = datetime.utcnow().isoformat() + 'Z'
+
+        # Fast path: nothing changed since the last build, refresh the timestamp
+        cached = self._full_status_cache
+        if cached is not None and time.monotonic() - self._full_status_ts < self.FULL_STATUS_MAX_AGE:
+            status = dict(cached)
+            status['timestamp'] = now_iso
+            return status
 
         # Get GAS project state
         gas_state = await self._read_gas_state()
@@ -71,29 +120,31 @@ class GASStatusGatherer:
         # Get all agent statuses
         agents = await self._gather_agent_statuses()
 
-        # Calculate overall progress
-        overall_progress = self._calculate_overall_progress(agents)
-
-        # Get waves/generations info
-        waves = self._organize_by_waves(agents)
+        # Tally statuses and group waves in one pass, then calculate overall progress
+        total_agents = len(agents)
+        tallies, waves = self._summarize_agents(agents)
+        overall_progress = self._calculate_overall_progress(tallies, total_agents)
 
         # Get knowledge/learnings
         learnings = await self._read_knowledge_store()
 
-        return {
+        status = {
             'swarm_name': gas_state.get('swarm_name', GAS_NAME),
             'swarm_mode': gas_state.get('mode', GAS_MODE),
             'overall_progress': overall_progress,
-            'start_time': gas_state.get('start_time', now.isoformat() + 'Z'),
+            'start_time': gas_state.get('start_time', now_iso),
             'agents': agents,
             'waves': waves,
-            'total_agents': len(agents),
-            'active_agents': sum(1 for a in agents.values() if a.get('status') == 'running'),
-            'completed_agents': sum(1 for a in agents.values() if a.get('status') == 'completed'),
+            'total_agents': total_agents,
+            'active_agents': tallies['running'],
+            'completed_agents': tallies['completed'],
             'learnings_count': len(learnings),
             'recent_learnings': learnings[-5:] if learnings else [],
-            'timestamp': now.isoformat() + 'Z',
+            'timestamp': now_iso,
         }
+        self._full_status_cache = status
+        self._full_status_ts = time.monotonic()
+        return status
 
     async def get_agent_details(self, agent_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -113,12 +164,15 @@ class GASStatusGatherer:
         if not agent_data:
             return None
 
+        # Copy so the detail fields don't leak into the cached agents dict
+        agent_data = dict(agent_data)
+
         # Add detailed output parsing
         output_file = agent_data.get('output_file')
         if output_file and os.path.exists(output_file):
             parsed = self._agent_parsed.get(agent_id)
             if parsed:
-                agent_data['live_events'] = parsed.live_events
+                agent_data['live_events'] = list(parsed.live_events)
                 agent_data['files_created'] = parsed.files_created
                 agent_data['files_modified'] = parsed.files_modified
                 agent_data['errors'] = parsed.errors
@@ -127,11 +181,11 @@ class GASStatusGatherer:
 
     async def get_recent_events(self) -> List[Dict[str, Any]]:
         """Get recent live events from all agents."""
-        return self._recent_events[-MAX_LIVE_EVENTS:]
+        return list(self._recent_events)
 
     async def get_new_events(self) -> List[Dict[str, Any]]:
         """Get new events since last check."""
-        events = self._new_events.copy()
+        events = list(self._new_events)
         self._new_events.clear()
         return events
 
@@ -142,41 +196,82 @@ class GASStatusGatherer:
         """
         has_changes = False
 
-        # Check GAS state file
-        gas_content, changed = self._file_tracker.get_new_content(self._gas_state_path)
-        if changed:
+        # Read the GAS state file and agent output files in one batch. The
+        # state path can switch to an alternate file while we await, so
+        # look results up under the path that was actually read
+        gas_state_path = self._gas_state_path
+        output_files = await asyncio.to_thread(self._find_agent_output_files)
+        results = await self._file_tracker.get_new_content_batch_async(
+            [gas_state_path, self._knowledge_path] + output_files
+        )
+
+        # Check GAS state and knowledge store files
+        if results[gas_state_path][1] or results[self._knowledge_path][1]:
             has_changes = True
 
-        # Check agent output files
-        output_files = self._find_agent_output_files()
-        for output_file in output_files:
-            content, changed = self._file_tracker.get_new_content(output_file)
-            if changed:
-                has_changes = True
-                # Parse incremental content
-                agent_id = self._extract_agent_id(output_file)
-                if agent_id:
-                    existing = self._agent_parsed.get(agent_id)
-                    parsed = parse_output_content(content, existing)
-                    self._agent_parsed[agent_id] = parsed
-
-                    # Add new events
-                    if parsed.live_events:
-                        for event in parsed.live_events[-10:]:
-                            event['agent_id'] = agent_id
-                            self._new_events.append(event)
-                            self._recent_events.append(event)
-
-        # Trim recent events
-        if len(self._recent_events) > MAX_LIVE_EVENTS * 2:
-            self._recent_events = self._recent_events[-MAX_LIVE_EVENTS:]
+        # Check agent output files; parse new content off the event loop
+        changed_files = [
+            (output_file, results[output_file][0])
+            for output_file in output_files
+            if results[output_file][1]
+        ]
+        if changed_files:
+            has_changes = True
+            self._dirty_files.update(output_file for output_file, _ in changed_files)
+            updates = await asyncio.to_thread(self._parse_changed_outputs, changed_files)
+
+            for agent_id, parsed in updates:
+                self._agent_parsed[agent_id] = parsed
+
+                # Add new events
+                if parsed.live_events:
+                    for event in list(parsed.live_events)[-10:]:
+                        event['agent_id'] = agent_id
+                        self._new_events.append(event)
+                        self._recent_events.append(event)
+
+        if has_changes:
+            self._agents_cache = None
+            self._full_status_cache = None
 
         self._last_check = datetime.utcnow()
         return has_changes
 
+    def _parse_changed_outputs(
+        self,
+        changed_files: List[Tuple[str, bytes]]
+    ) -> List[Tuple[str, ParsedOutput]]:
+        """
+        Parse new output content into copies of each agent's accumulated
+        result. Blocking; called via asyncio.to_thread. Returns
+        (agent_id, parsed) per file, in order, for the loop to swap in.
+        """
+        updates = []
+        parsed_here: Dict[str, ParsedOutput] = {}
+        for output_file, content in changed_files:
+            agent_id = self._extract_agent_id(output_file)
+            if not agent_id:
+                continue
+            existing = parsed_here.get(agent_id)
+            if existing is None:
+                # The published result may be serialized on the loop meanwhile
+                shared = self._agent_parsed.get(agent_id)
+                existing = shared.copy() if shared is not None else None
+            parsed = parse_output_content(content, existing)
+            parsed_here[agent_id] = parsed
+            updates.append((agent_id, parsed))
+        return updates
+
     async def _read_gas_state(self) -> Dict[str, Any]:
+        """Read gas-state.json file without blocking the event loop."""
+        return await asyncio.to_thread(self._read_gas_state_sync)
+
+    def _read_gas_state_sync(self) -> Dict[str, Any]:
         """Read gas-state.json file."""
-        if not os.path.exists(self._gas_state_path):
+        # Work on a local copy: this runs in a worker thread, and the
+        # attribute is published with a single assignment
+        gas_state_path = self._gas_state_path
+        if not os.path.exists(gas_state_path):
             # Try alternative locations
             alt_paths = [
                 os.path.join(self.gas_dir, 'swarm-config.json'),
@@ -184,44 +279,95 @@ class GASStatusGatherer:
             ]
             for alt_path in alt_paths:
                 if os.path.exists(alt_path):
-                    self._gas_state_path = alt_path
+                    gas_state_path = self._gas_state_path = alt_path
                     break
 
+        key = self._stat_key(gas_state_path)
+        if key is not None and key == self._last_state_key:
+            return self._gas_state
+
         try:
-            if os.path.exists(self._gas_state_path):
-                with open(self._gas_state_path, 'r') as f:
-                    return json.load(f)
+            if key is not None:
+                with open(gas_state_path, 'rb') as f:
+                    self._gas_state = _json_loads(f.read())
+                self._last_state_key = key
+                return self._gas_state
         except Exception as e:
             logger.error(f"Error reading GAS state: {e}")
 
         return {'swarm_name': GAS_NAME, 'mode': GAS_MODE}
 
     async def _read_knowledge_store(self) -> List[Dict[str, Any]]:
+        """Read knowledge/store.json for learnings without blocking the event loop."""
+        return await asyncio.to_thread(self._read_knowledge_store_sync)
+
+    def _read_knowledge_store_sync(self) -> List[Dict[str, Any]]:
         """Read knowledge/store.json for learnings."""
+        key = self._stat_key(self._knowledge_path)
+        if key is not None and key == self._last_knowledge_key:
+            return self._knowledge
+
         try:
-            if os.path.exists(self._knowledge_path):
-                with open(self._knowledge_path, 'r') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        return data
-                    elif isinstance(data, dict):
-                        return data.get('learnings', data.get('entries', []))
+            if key is not None:
+                with open(self._knowledge_path, 'rb') as f:
+                    data = _json_loads(f.read())
+                learnings = []
+                if isinstance(data, list):
+                    learnings = data
+                elif isinstance(data, dict):
+                    learnings = data.get('learnings', data.get('entries', []))
+                self._knowledge = learnings
+                self._last_knowledge_key = key
+                return learnings
         except Exception as e:
             logger.debug(f"Could not read knowledge store: {e}")
 
         return []
 
+    @staticmethod
+    def _stat_key(path: str) -> Optional[Tuple[str, int, int]]:
+        """Return (path, size, mtime_ns) for a file, or None if it is missing."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (path, st.st_size, st.st_mtime_ns)
+
     async def _gather_agent_statuses(self) -> Dict[str, Dict[str, Any]]:
-        """Gather status for all discovered agents."""
+        """
+        Gather status for all discovered agents.
+        Reuses the previous result for AGENTS_CACHE_TTL seconds.
+        """
+        if (self._agents_cache is not None
+                and time.monotonic() - self._agents_cache_ts < self.AGENTS_CACHE_TTL):
+            return self._agents_cache
+
+        agents = await self._collect_agent_statuses()
+        self._agents_cache = agents
+        self._agents_cache_ts = time.monotonic()
+        return agents
+
+    async def _collect_agent_statuses(self) -> Dict[str, Dict[str, Any]]:
+        """Build status for all discovered agents from state and output files."""
         agents = {}
-        now = datetime.utcnow()
+        now_epoch = time.time()
+
+        # Take the dirty set so changes seen while gathering mark the next gather
+        dirty, self._dirty_files = self._dirty_files, set()
 
         # Read GAS state for agent config
         gas_state = await self._read_gas_state()
         agent_configs = gas_state.get('agents', {})
 
         # Find agent output files
-        output_files = self._find_agent_output_files()
+        output_files = await asyncio.to_thread(self._find_agent_output_files)
+
+        # Index output files by extracted agent/task ID once per gather
+        file_ids = [(f, self._extract_agent_id(f)) for f in output_files]
+        by_task: Dict[str, str] = {}
+        for output_file, file_id in file_ids:
+            if file_id:
+                by_task.setdefault(file_id, output_file)
 
         # Build agent status from configs
         for agent_id, config in agent_configs.items():
@@ -245,17 +391,20 @@ class GASStatusGatherer:
             # Try to find output file for this agent
             task_id = config.get('task_id')
             if task_id:
-                for output_file in output_files:
-                    if task_id in output_file:
-                        agent_data['output_file'] = output_file
-                        break
+                output_file = by_task.get(task_id)
+                if output_file is None:
+                    # Fall back to a substring match anywhere in the path
+                    output_file = next((f for f in output_files if task_id in f), None)
+                agent_data['output_file'] = output_file
 
             # Parse output file if found
             output_file = agent_data.get('output_file')
-            if output_file and os.path.exists(output_file):
-                parsed = self._parse_agent_output(output_file, agent_id)
+            parsed = None
+            if output_file:
+                parsed = await self._get_parsed_output(output_file, agent_id, dirty)
 
-                agent_data['status'] = self._determine_agent_status(parsed, now)
+            if parsed:
+                agent_data['status'] = self._determine_agent_status(parsed, now_epoch)
                 agent_data['progress'] = parsed.progress_estimate
                 agent_data['current_task'] = parsed.current_task
                 agent_data['tools_used'] = parsed.tools_used
@@ -263,16 +412,16 @@ class GASStatusGatherer:
                 agent_data['files_modified'] = parsed.files_modified
                 agent_data['has_completion'] = parsed.has_completion_marker
 
-                if parsed.last_activity:
-                    agent_data['last_activity'] = parsed.last_activity.isoformat() + 'Z'
+                agent_data['last_activity'] = parsed.last_activity_iso()
 
             agents[agent_id] = agent_data
 
         # Also discover any agents from output files not in config
-        for output_file in output_files:
-            agent_id = self._extract_agent_id(output_file)
+        for output_file, agent_id in file_ids:
             if agent_id and agent_id not in agents:
-                parsed = self._parse_agent_output(output_file, agent_id)
+                parsed = await self._get_parsed_output(output_file, agent_id, dirty)
+                if not parsed:
+                    continue
                 agents[agent_id] = {
                     'id': agent_id,
                     'role': 'Agent',
@@ -280,82 +429,157 @@ class GASStatusGatherer:
                     'generation': 1,
                     'mission': '',
                     'task_id': agent_id,
-                    'status': self._determine_agent_status(parsed, now),
+                    'status': self._determine_agent_status(parsed, now_epoch),
                     'progress': parsed.progress_estimate,
                     'current_task': parsed.current_task,
                     'tools_used': parsed.tools_used,
                     'files_created': parsed.files_created,
                     'files_modified': parsed.files_modified,
                     'has_completion': parsed.has_completion_marker,
-                    'last_activity': parsed.last_activity.isoformat() + 'Z' if parsed.last_activity else None,
+                    'last_activity': parsed.last_activity_iso(),
                     'output_file': output_file,
                 }
 
         return agents
 
     def _find_agent_output_files(self) -> List[str]:
-        """Find all agent output files in task directory."""
-        output_files = []
-
-        # Check task directory patterns
-        patterns = [
-            os.path.join(self.task_dir, '**/output.ndjson'),
-            os.path.join(self.task_dir, '**/output.jsonl'),
-            os.path.join(self.task_dir, '*/output'),
-            os.path.join(self.task_dir, '*/output.ndjson'),
-            os.path.join(self.gas_dir, 'output', '*.ndjson'),
-            os.path.join(self.gas_dir, 'output', '*', 'output.ndjson'),
-        ]
-
-        for pattern in patterns:
-            output_files.extend(glob.glob(pattern, recursive=True))
+        """
+        Find all agent output files in task directory.
 
-        # Deduplicate
-        return list(set(output_files))
+        Matches output.ndjson/output.jsonl at any depth and */output under
+        the task directory, plus *.ndjson and */output.ndjson under the GAS
+        output directory. Results are reused until the mtime of a directory
+        visited by the last walk changes; adding or removing an entry
+        updates the mtime of its parent directory.
+        """
+        if self._glob_cache is not None:
+            watched = [d for d, _ in self._glob_dir_mtimes]
+            if self._dir_mtimes(watched) == self._glob_dir_mtimes:
+                return self._glob_cache
+
+        output_files: List[str] = []
+        visited: List[str] = []
+
+        self._walk_output_dir(
+            self.task_dir, None,
+            lambda name, depth: (
+                name == 'output.ndjson' or name == 'output.jsonl'
+                or (name == 'output' and depth == 1)
+            ),
+            output_files, visited,
+        )
+        self._walk_output_dir(
+            os.path.join(self.gas_dir, 'output'), 1,
+            lambda name, depth: (
+                (depth == 0 and name.endswith('.ndjson'))
+                or (depth == 1 and name == 'output.ndjson')
+            ),
+            output_files, visited,
+        )
+
+        # Deduplicate, keeping discovery order
+        self._glob_cache = list(dict.fromkeys(output_files))
+        self._glob_dir_mtimes = self._dir_mtimes(visited)
+        return self._glob_cache
+
+    @staticmethod
+    def _walk_output_dir(
+        root: str,
+        max_depth: Optional[int],
+        match: Callable[[str, int], bool],
+        found: List[str],
+        visited: List[str],
+    ) -> None:
+        """
+        Walk root with os.scandir, appending matching file paths to found and
+        every directory walked to visited. Hidden entries are skipped and
+        symlinked directories are not followed.
+        """
+        stack = [(root, 0)]
+        while stack:
+            directory, depth = stack.pop()
+            visited.append(directory)
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith('.'):
+                        continue
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if max_depth is None or depth < max_depth:
+                            stack.append((entry.path, depth + 1))
+                    elif match(name, depth):
+                        found.append(entry.path)
+
+    @staticmethod
+    def _dir_mtimes(dirs: List[str]) -> Tuple[Tuple[str, int], ...]:
+        """Snapshot (path, st_mtime_ns) for each directory, 0 if missing."""
+        mtimes = []
+        for d in dirs:
+            try:
+                mtimes.append((d, os.stat(d).st_mtime_ns))
+            except OSError:
+                mtimes.append((d, 0))
+        return tuple(mtimes)
 
     def _extract_agent_id(self, output_file: str) -> Optional[str]:
         """Extract agent ID from output file path."""
-        parts = Path(output_file).parts
-        for i, part in enumerate(parts):
-            if part.startswith('a') and len(part) == 7:
-                return part
-            if 'agent' in part.lower():
-                return part
+        match = _AGENT_ID_RE.search(output_file)
+        if match:
+            return match.group(1)
 
         # Use directory name
-        return Path(output_file).parent.name
+        return os.path.basename(os.path.dirname(output_file))
 
-    def _parse_agent_output(self, output_file: str, agent_id: str) -> ParsedOutput:
-        """Parse an agent output file with caching."""
-        # Check cache
-        cache_key = f"{output_file}:{os.path.getmtime(output_file)}"
-        cached = self._parse_cache.get(cache_key)
-        if cached:
-            return ParsedOutput(**cached)
+    async def _get_parsed_output(
+        self,
+        output_file: str,
+        agent_id: str,
+        dirty: Set[str]
+    ) -> Optional[ParsedOutput]:
+        """
+        Return the agent's parsed output, reusing the in-memory result unless
+        check_for_changes saw its output file change since the last gather.
+        """
+        parsed = self._agent_parsed.get(agent_id)
+        if parsed is not None and output_file not in dirty:
+            return parsed
+        parsed = await asyncio.to_thread(self._parse_agent_output, output_file)
+        if parsed is not None:
+            self._agent_parsed[agent_id] = parsed
+        return parsed
 
-        # Get content and parse
+    def _parse_agent_output(self, output_file: str) -> Optional[ParsedOutput]:
+        """
+        Parse an agent output file with caching.
+        Blocking; called via asyncio.to_thread. Returns None if the file is gone.
+        """
+        # Check cache, keyed on the tracker's read position so no stat is needed
+        position = self._file_tracker.position(output_file)
+        if position is not None:
+            cached = self._parse_cache.get_with_position(output_file, position)
+            if cached is not None:
+                return cached
+
+        # Get content and parse; an untracked file afterwards means it's gone
         content = self._file_tracker.get_all_content(output_file)
+        position = self._file_tracker.position(output_file)
+        if position is None:
+            return None
         parsed = parse_output_content(content)
 
-        # Store in cache and agent parsed dict
-        self._parse_cache.set(cache_key, {
-            'total_events': parsed.total_events,
-            'tools_used': parsed.tools_used,
-            'files_created': parsed.files_created,
-            'files_modified': parsed.files_modified,
-            'live_events': parsed.live_events,
-            'last_activity': parsed.last_activity,
-            'has_completion_marker': parsed.has_completion_marker,
-            'progress_estimate': parsed.progress_estimate,
-            'current_task': parsed.current_task,
-            'errors': parsed.errors,
-            'raw_lines_count': parsed.raw_lines_count,
-        })
-
-        self._agent_parsed[agent_id] = parsed
+        self._parse_cache.set_with_position(output_file, position, parsed)
         return parsed
 
-    def _determine_agent_status(self, parsed: ParsedOutput, now: datetime) -> str:
+    def _determine_agent_status(self, parsed: ParsedOutput, now_epoch: float) -> str:
         """Determine agent status based on parsed output."""
         if parsed.has_completion_marker:
             return 'completed'
@@ -366,13 +590,7 @@ class GASStatusGatherer:
             return 'idle'
 
         # Calculate time since last activity
-        if parsed.last_activity.tzinfo is None:
-            last_activity = parsed.last_activity.replace(tzinfo=timezone.utc)
-        else:
-            last_activity = parsed.last_activity
-
-        now_utc = now.replace(tzinfo=timezone.utc) if now.tzinfo is None else now
-        seconds_since_activity = (now_utc - last_activity).total_seconds()
+        seconds_since_activity = now_epoch - parsed.last_activity_epoch
 
         if seconds_since_activity > COMPLETION_THRESHOLD_SECONDS:
             return 'completed' if parsed.total_events > 20 else 'idle'
@@ -381,65 +599,69 @@ class GASStatusGatherer:
         else:
             return 'running'
 
-    def _calculate_overall_progress(self, agents: Dict[str, Dict[str, Any]]) -> int:
-        """Calculate overall progress percentage."""
-        if not agents:
-            return 0
-
-        total_progress = sum(a.get('progress', 0) for a in agents.values())
-        completed = sum(1 for a in agents.values() if a.get('status') == 'completed')
-
-        # Weight completion more heavily
-        completion_bonus = (completed / len(agents)) * 50 if agents else 0
-        avg_progress = (total_progress / len(agents)) * 0.5 if agents else 0
-
-        return min(100, int(avg_progress + completion_bonus))
+    def _summarize_agents(
+        self,
+        agents: Dict[str, Dict[str, Any]]
+    ) -> Tuple[Dict[str, int], Dict[int, Dict[str, Any]]]:
+        """
+        Count agents per status, sum their progress and organize them by
+        wave/generation in a single pass over the agents dict.
 
-    def _organize_by_waves(self, agents: Dict[str, Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
-        """Organize agents by wave/generation."""
-        waves: Dict[int, Dict[str, Any]] = {}
+        Tallies are a Counter keyed by status plus 'progress', so missing
+        statuses read as 0. Every status is counted, including unknown ones.
+        """
+        tallies: Counter = Counter()
+        wave_agents: DefaultDict[int, List[str]] = defaultdict(list)
+        wave_counts: DefaultDict[int, Counter] = defaultdict(Counter)
 
         for agent_id, agent_data in agents.items():
+            status = agent_data.get('status', 'pending')
             wave = agent_data.get('wave', 1)
+            tallies[status] += 1
+            tallies['progress'] += agent_data.get('progress', 0)
+            wave_counts[wave][status] += 1
+            wave_agents[wave].append(agent_id)
+
+        waves = {
+            wave: {
+                'wave': wave,
+                'agents': agent_ids,
+                'total': len(agent_ids),
+                **_WAVE_STATUS_ZEROS,
+                **wave_counts[wave],
+            }
+            for wave, agent_ids in wave_agents.items()
+        }
+        return tallies, waves
 
-            if wave not in waves:
-                waves[wave] = {
-                    'wave': wave,
-                    'agents': [],
-                    'total': 0,
-                    'running': 0,
-                    'completed': 0,
-                    'idle': 0,
-                    'pending': 0,
-                }
-
-            wave_data = waves[wave]
-            wave_data['agents'].append(agent_id)
-            wave_data['total'] += 1
+    def _calculate_overall_progress(self, tallies: Dict[str, int], total_agents: int) -> int:
+        """Calculate overall progress percentage from agent tallies."""
+        if not total_agents:
+            return 0
 
-            status = agent_data.get('status', 'pending')
-            if status in wave_data:
-                wave_data[status] += 1
+        # Weight completion more heavily
+        completion_bonus = (tallies['completed'] / total_agents) * 50
+        avg_progress = (tallies['progress'] / total_agents) * 0.5
 
-        return waves
+        return min(100, int(avg_progress + completion_bonus))
 
 
 def detect_agent_generations(agents: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Detect agent generations and successions.
-    Returns list of generation events.
+    Returns list of generation events, ordered by generation then agent ID.
     """
-    generations = []
-
-    for agent_id, agent_data in agents.items():
-        gen = agent_data.get('generation', 1)
-        if gen > 1:
-            generations.append({
+    return sorted(
+        (
+            {
                 'agent_id': agent_id,
-                'generation': gen,
+                'generation': agent_data['generation'],
                 'role': agent_data.get('role'),
                 'parent': agent_data.get('parent_agent'),
                 'timestamp': agent_data.get('start_time'),
-            })
-
-    return sorted(generations, key=lambda x: (x['generation'], x['agent_id']))
+            }
+            for agent_id, agent_data in agents.items()
+            if agent_data.get('generation', 1) > 1
+        ),
+        key=_GENERATION_ORDER,
+    )
@@ -5,14 +5,26 @@ HTTP Request Handler
 Asyncio-based HTTP server for serving static files and API endpoints.
 """
 import asyncio
+import functools
+import gzip
+import hashlib
 import json
-import mimetypes
 import os
+import socket
+import stat
+import time
+from collections.abc import Mapping as MappingABC
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, TYPE_CHECKING
+from typing import Dict, Any, Iterator, Mapping, Optional, Set, Tuple, TYPE_CHECKING
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from .gas_status import GASStatusGatherer
     from .websocket_handler import WebSocketManager
@@ -36,14 +48,166 @@ CONTENT_TYPES = {
     '.ttf': 'font/ttf',
 }
 
+# Shared response header dicts; handle_client reads them without mutating
+_HTML_HEADERS = {'Content-Type': 'text/html; charset=utf-8'}
+_JSON_HEADERS = {
+    'Content-Type': 'application/json; charset=utf-8',
+    'Cache-Control': 'no-cache'
+}
+_JSON_GZIP_HEADERS = {
+    **_JSON_HEADERS,
+    'Content-Encoding': 'gzip',
+    'Vary': 'Accept-Encoding',
+}
+
+# JSON bodies smaller than this are sent uncompressed; gzip overhead dominates
+GZIP_MIN_SIZE = 512
+
+# Prebuilt status lines and trailing headers shared by every response
+_STATUS_LINES = {
+    code: f'HTTP/1.1 {code} {text}\r\n'.encode('latin-1')
+    for code, text in (
+        (200, 'OK'),
+        (304, 'Not Modified'),
+        (404, 'Not Found'),
+        (431, 'Request Header Fields Too Large'),
+        (500, 'Internal Server Error'),
+    )
+}
+
+# Seconds an idle keep-alive connection is held open between requests
+KEEP_ALIVE_TIMEOUT = 15
+
+_CLOSE_TAIL = b'Connection: close\r\nAccess-Control-Allow-Origin: *\r\n\r\n'
+_KEEP_ALIVE_TAIL = (
+    b'Connection: keep-alive\r\nKeep-Alive: timeout=%d\r\n'
+    b'Access-Control-Allow-Origin: *\r\n\r\n' % KEEP_ALIVE_TIMEOUT
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _gzip_body(body: bytes) -> bytes:
+    """
+    Gzip a response body at level 1. Cached, so a status polled again
+    before it changes is not recompressed.
+    """
+    return gzip.compress(body, compresslevel=1, mtime=0)
+
+
+@functools.lru_cache(maxsize=64)
+def _header_block(items: Tuple[Tuple[str, str], ...]) -> bytes:
+    """Encode handler headers once per distinct header set."""
+    return ''.join(f'{key}: {value}\r\n' for key, value in items).encode('latin-1')
+
+
 # Server start time for uptime tracking
 SERVER_START_TIME = datetime.utcnow()
+SERVER_START_ISO = SERVER_START_TIME.isoformat() + 'Z'
+# Monotonic start time for uptime; unaffected by wall-clock jumps
+SERVER_START_MONO = time.monotonic()
+_SERVER_START_ISO_BYTES = SERVER_START_ISO.encode('ascii')
+
+# /health body; filled with uptime, start time and connection count
+_HEALTH_TEMPLATE = (
+    b'{"status":"healthy","uptime_seconds":%.2f,'
+    b'"server_start":"%b","websocket_connections":%d}'
+)
+
+
+@dataclass(slots=True)
+class _StaticFile:
+    """A frontend file held in memory, with its validators."""
+    body: bytes
+    headers: Dict[str, str]
+    etag: str
+    key: Tuple[int, int]  # (mtime_ns, size) when read
+    checked: float  # time.monotonic() of the last stat
+
+
+class _RequestHeaders(MappingABC):
+    """
+    Read-only header mapping over the raw request head.
+
+    Single lookups search the lowercased head for the name, so only the
+    headers a request actually uses are decoded; the full dict is built
+    on first iteration.
+    """
+    __slots__ = ('_head', '_lower', '_parsed')
+
+    def __init__(self, head: bytes):
+        # head is the request line and headers, ending in a blank line
+        self._head = head
+        self._lower = head.lower()
+        self._parsed: Optional[Dict[str, str]] = None
+
+    def __getitem__(self, name: str) -> str:
+        if self._parsed is not None:
+            return self._parsed[name]
+        start = self._lower.find(b'\r\n' + name.encode('latin-1') + b':')
+        if start < 0:
+            raise KeyError(name)
+        start += len(name) + 3
+        end = self._head.index(b'\r\n', start)
+        # Header names and values are ASCII; latin-1 decodes without checks
+        return self._head[start:end].strip().decode('latin-1')
+
+    def _parse(self) -> Dict[str, str]:
+        if self._parsed is None:
+            parsed = {}
+            for line in self._head[:-4].split(b'\r\n')[1:]:
+                key, sep, value = line.partition(b':')
+                if sep:
+                    parsed[key.strip().lower().decode('latin-1')] = value.strip().decode('latin-1')
+            self._parsed = parsed
+        return self._parsed
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._parse())
+
+    def __len__(self) -> int:
+        return len(self._parse())
+
+
+def _dumps_json(data: Any) -> bytes:
+    """
+    Serialize data to compact JSON bytes, using orjson when available.
+    Non-string keys (wave numbers) and datetimes are handled like
+    json.dumps(default=str).
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    return json.dumps(data, default=str, separators=(',', ':')).encode('utf-8')
+
+
+# Body of the default 404, shared by every unknown path
+_NOT_FOUND_BODY = _dumps_json({'error': 'Not Found'})
+
+
+# Files at least this large are read in a worker thread; smaller reads are
+# cheaper inline than the thread hand-off
+ASYNC_READ_MIN_SIZE = 4096
+
+
+async def _read_file_bytes(file_path: Path, size: int) -> bytes:
+    """Read a file, off the event loop if it is ASYNC_READ_MIN_SIZE or larger."""
+    if size >= ASYNC_READ_MIN_SIZE:
+        return await asyncio.to_thread(file_path.read_bytes)
+    return file_path.read_bytes()
+
+
+@functools.lru_cache(maxsize=32)
+def _content_type_for_ext(ext: str) -> str:
+    """Get content type for a file extension, matched case-insensitively."""
+    return CONTENT_TYPES.get(ext.lower(), 'application/octet-stream')
 
 
 def get_content_type(file_path: str) -> str:
     """Get content type for a file based on extension."""
-    ext = os.path.splitext(file_path)[1].lower()
-    return CONTENT_TYPES.get(ext, 'application/octet-stream')
+    return _content_type_for_ext(os.path.splitext(file_path)[1])
 
 
 class HTTPRequestHandler:
@@ -51,6 +215,11 @@ class HTTPRequestHandler:
     Handle HTTP requests asynchronously.
     """
 
+    # Seconds between stat checks of index.html
+    INDEX_RECHECK_SECONDS = 1.0
+    # Seconds a /health body is reused
+    HEALTH_REFRESH_SECONDS = 0.25
+
     def __init__(
         self,
         status_gatherer: 'GASStatusGatherer',
@@ -68,102 +237,249 @@ class HTTPRequestHandler:
             server_dir = Path(__file__).parent
             self.frontend_dir = server_dir.parent / 'frontend'
 
+        # Resolved once; static paths are checked against it as strings
+        self._frontend_resolved = str(self.frontend_dir.resolve())
+        self._frontend_prefix = os.path.join(self._frontend_resolved, '')
+
+        # index.html bytes keyed on (mtime_ns, size); None when absent
+        self._placeholder_bytes = self._get_placeholder_html().encode('utf-8')
+        self._index_body: Optional[bytes] = None
+        self._index_key: Optional[Tuple[int, int]] = None
+        self._index_checked = float('-inf')
+
+        # Last /health body and when it was built
+        self._health_body = b''
+        self._health_built = float('-inf')
+
+        # Route table: exact paths hash straight to a handler
+        self._exact_routes = {
+            '/': self._serve_index,
+            '/index.html': self._serve_index,
+            '/health': self._handle_health,
+            '/api/status': self._handle_api_status,
+            '/api/events': self._handle_api_events,
+        }
+        self._prefix_routes = [
+            ('/api/agent/', self._handle_api_agent_path),
+        ]
+
+        # Frontend files by normalized file path, preloaded and revalidated
+        # like index.html
+        self._static_cache: Dict[str, _StaticFile] = {}
+        self._preload_static()
+
     async def handle_request(
         self,
         method: str,
         path: str,
-        headers: Dict[str, str],
+        headers: Mapping[str, str],
         body: bytes = b''
     ) -> Tuple[int, Dict[str, str], bytes]:
         """
         Handle an HTTP request and return (status_code, headers, body).
         """
-        # Route the request
-        if path == '/' or path == '/index.html':
-            return await self._serve_index()
-        elif path == '/health':
-            return await self._handle_health()
-        elif path == '/api/status':
-            return await self._handle_api_status()
-        elif path.startswith('/api/agent/'):
-            agent_id = path.split('/api/agent/')[-1].rstrip('/')
-            return await self._handle_api_agent(agent_id)
-        elif path == '/api/events':
-            return await self._handle_api_events()
-        elif path.startswith('/'):
-            return await self._serve_static(path)
-        else:
-            return self._not_found()
+        status_code, response_headers, response_body = await self._route(path, headers)
+
+        # Gzip JSON for clients that accept it
+        if (
+            response_headers is _JSON_HEADERS
+            and len(response_body) >= GZIP_MIN_SIZE
+            and 'gzip' in headers.get('accept-encoding', '')
+        ):
+            return status_code, _JSON_GZIP_HEADERS, _gzip_body(response_body)
+        return status_code, response_headers, response_body
+
+    async def _route(
+        self,
+        path: str,
+        headers: Mapping[str, str]
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """Route the request: exact paths first, then prefixes, then static files."""
+        handler = self._exact_routes.get(path)
+        if handler is not None:
+            return await handler()
 
-    async def _serve_index(self) -> Tuple[int, Dict[str, str], bytes]:
-        """Serve the main index.html page."""
-        index_path = self.frontend_dir / 'index.html'
+        for prefix, prefix_handler in self._prefix_routes:
+            if path.startswith(prefix):
+                return await prefix_handler(path[len(prefix):])
 
-        if index_path.exists():
+        if path.startswith('/'):
+            return await self._serve_static(path, headers)
+        return self._not_found()
+
+    async def _handle_api_agent_path(self, rest: str) -> Tuple[int, Dict[str, str], bytes]:
+        """Handle /api/agent/{id}, given the path after the prefix."""
+        agent_id = rest.rstrip('/')
+        return await self._handle_api_agent(agent_id)
+
+    async def _serve_index(self) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Serve the main index.html page.
+        The file is stat'ed at most once per INDEX_RECHECK_SECONDS and only
+        re-read when it changed; the placeholder is pre-encoded.
+        """
+        now = time.monotonic()
+        if now - self._index_checked >= self.INDEX_RECHECK_SECONDS:
             try:
-                content = index_path.read_bytes()
-                return (
-                    200,
-                    {'Content-Type': 'text/html; charset=utf-8'},
-                    content
-                )
+                await self._refresh_index()
             except Exception as e:
                 logger.error(f"Error reading index.html: {e}")
                 return self._internal_error(str(e))
+            self._index_checked = now
 
-        # Return a placeholder if frontend not yet available
-        placeholder = self._get_placeholder_html()
-        return (
-            200,
-            {'Content-Type': 'text/html; charset=utf-8'},
-            placeholder.encode('utf-8')
-        )
+        if self._index_body is not None:
+            return 200, _HTML_HEADERS, self._index_body
 
-    async def _serve_static(self, path: str) -> Tuple[int, Dict[str, str], bytes]:
-        """Serve static files from the frontend directory."""
-        # Sanitize path to prevent directory traversal
-        safe_path = path.lstrip('/').replace('..', '')
-        file_path = self.frontend_dir / safe_path
-
-        if not file_path.exists() or not file_path.is_file():
-            return self._not_found()
+        # Return a placeholder if frontend not yet available
+        return 200, _HTML_HEADERS, self._placeholder_bytes
 
-        # Check that path is within frontend directory
+    async def _refresh_index(self) -> None:
+        """Reload index.html if its mtime or size changed since the last read."""
+        index_path = self.frontend_dir / 'index.html'
         try:
-            file_path.resolve().relative_to(self.frontend_dir.resolve())
-        except ValueError:
+            st = index_path.stat()
+        except OSError:
+            self._index_body = None
+            self._index_key = None
+            return
+
+        key = (st.st_mtime_ns, st.st_size)
+        if key != self._index_key:
+            self._index_body = await _read_file_bytes(index_path, st.st_size)
+            self._index_key = key
+
+    async def _serve_static(
+        self,
+        path: str,
+        headers: Optional[Mapping[str, str]] = None
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Serve static files from the frontend directory.
+        Files come from an in-memory table and are stat'ed at most once per
+        INDEX_RECHECK_SECONDS; a matching If-None-Match gets a 304.
+        """
+        # Key on the file path, not the URL: '/./js/app.js' and '//js/app.js'
+        # must share one entry, or every spelling would add another copy
+        file_path = self._static_path(path)
+        if file_path is None:
             return self._not_found()
 
+        entry = self._static_cache.get(file_path)
+        now = time.monotonic()
+        if entry is None or now - entry.checked >= self.INDEX_RECHECK_SECONDS:
+            try:
+                entry = await self._load_static(file_path, entry, now)
+            except Exception as e:
+                logger.error(f"Error serving static file {path}: {e}")
+                return self._internal_error(str(e))
+            if entry is None:
+                self._static_cache.pop(file_path, None)
+                return self._not_found()
+            self._static_cache[file_path] = entry
+
+        if headers and headers.get('if-none-match') == entry.etag:
+            return 304, entry.headers, b''
+        return 200, entry.headers, entry.body
+
+    def _preload_static(self) -> None:
+        """Load every file under the frontend directory into the static table."""
+        now = time.monotonic()
+        for dirpath, _, filenames in os.walk(self.frontend_dir):
+            for filename in filenames:
+                rel = os.path.relpath(os.path.join(dirpath, filename), self.frontend_dir)
+                path = '/' + rel.replace(os.sep, '/')
+                file_path = self._static_path(path)
+                st = self._stat_static(file_path) if file_path else None
+                if st is None:
+                    continue
+                try:
+                    with open(file_path, 'rb') as f:
+                        body = f.read()
+                    self._static_cache[file_path] = self._make_static_entry(
+                        file_path, st, body, now
+                    )
+                except OSError as e:
+                    logger.debug(f"Could not preload {path}: {e}")
+
+    async def _load_static(
+        self,
+        file_path: str,
+        entry: Optional[_StaticFile],
+        now: float
+    ) -> Optional[_StaticFile]:
+        """
+        Return the table entry for a file, re-reading it only if its mtime
+        or size changed. Returns None if there is no such file.
+        """
+        st = self._stat_static(file_path)
+        if st is None:
+            return None
+
+        if entry is not None and entry.key == (st.st_mtime_ns, st.st_size):
+            entry.checked = now
+            return entry
+
+        body = await _read_file_bytes(Path(file_path), st.st_size)
+        return self._make_static_entry(file_path, st, body, now)
+
+    def _static_path(self, path: str) -> Optional[str]:
+        """Map a URL path to a normalized path within the frontend directory."""
+        # Normalize and check the prefix to prevent directory traversal
+        candidate = os.path.normpath(
+            os.path.join(self._frontend_resolved, path.lstrip('/'))
+        )
+        if not candidate.startswith(self._frontend_prefix):
+            return None
+        return candidate
+
+    @staticmethod
+    def _stat_static(file_path: str) -> Optional[os.stat_result]:
+        """Stat a static file; None if it is missing or not a regular file."""
         try:
-            content = file_path.read_bytes()
-            content_type = get_content_type(str(file_path))
-            return (
-                200,
-                {
-                    'Content-Type': content_type,
-                    'Cache-Control': 'public, max-age=3600'
-                },
-                content
-            )
-        except Exception as e:
-            logger.error(f"Error serving static file {file_path}: {e}")
-            return self._internal_error(str(e))
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        return st
+
+    @staticmethod
+    def _make_static_entry(
+        file_path: str,
+        st: os.stat_result,
+        body: bytes,
+        now: float
+    ) -> _StaticFile:
+        """Build a static table entry with prebuilt headers and an ETag."""
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        return _StaticFile(
+            body=body,
+            headers={
+                'Content-Type': get_content_type(file_path),
+                'Cache-Control': 'public, max-age=3600',
+                'ETag': etag,
+            },
+            etag=etag,
+            key=(st.st_mtime_ns, st.st_size),
+            checked=now,
+        )
 
     async def _handle_health(self) -> Tuple[int, Dict[str, str], bytes]:
-        """Handle /health endpoint."""
-        uptime_seconds = (datetime.utcnow() - SERVER_START_TIME).total_seconds()
-
-        health_data = {
-            'status': 'healthy',
-            'uptime_seconds': round(uptime_seconds, 2),
-            'server_start': SERVER_START_TIME.isoformat() + 'Z',
-            'websocket_connections': (
-                self.ws_manager.connection_count
-                if self.ws_manager else 0
-            ),
-        }
+        """
+        Handle /health endpoint.
+        The body is filled from a byte template, at most once per
+        HEALTH_REFRESH_SECONDS.
+        """
+        now = time.monotonic()
+        if now - self._health_built >= self.HEALTH_REFRESH_SECONDS:
+            self._health_body = _HEALTH_TEMPLATE % (
+                now - SERVER_START_MONO,
+                _SERVER_START_ISO_BYTES,
+                self.ws_manager.connection_count if self.ws_manager else 0,
+            )
+            self._health_built = now
 
-        return self._json_response(health_data)
+        return 200, _JSON_HEADERS, self._health_body
 
     async def _handle_api_status(self) -> Tuple[int, Dict[str, str], bytes]:
         """Handle /api/status endpoint - return full GAS status."""
@@ -200,18 +516,12 @@ class HTTPRequestHandler:
         status_code: int = 200
     ) -> Tuple[int, Dict[str, str], bytes]:
         """Create a JSON response."""
-        content = json.dumps(data, indent=2, default=str)
-        return (
-            status_code,
-            {
-                'Content-Type': 'application/json; charset=utf-8',
-                'Cache-Control': 'no-cache'
-            },
-            content.encode('utf-8')
-        )
+        return status_code, _JSON_HEADERS, _dumps_json(data)
 
     def _not_found(self, message: str = 'Not Found') -> Tuple[int, Dict[str, str], bytes]:
         """Return a 404 response."""
+        if message == 'Not Found':
+            return 404, _JSON_HEADERS, _NOT_FOUND_BODY
         return self._json_response({'error': message}, 404)
 
     def _internal_error(self, message: str) -> Tuple[int, Dict[str, str], bytes]:
@@ -304,90 +614,96 @@ class AsyncHTTPServer:
     Asyncio-based HTTP server.
     """
 
+    # Send buffer requested for accepted connections
+    SEND_BUFFER_SIZE = 256 * 1024
+
     def __init__(
         self,
         handler: HTTPRequestHandler,
         host: str = '0.0.0.0',
-        port: int = 8080
+        port: int = 8080,
+        reuse_port: bool = False
     ):
         self.handler = handler
         self.host = host
         self.port = port
+        # Let sibling worker processes bind the same port
+        self.reuse_port = reuse_port
         self._server = None
+        # Open connections, so idle keep-alive clients can be closed on shutdown
+        self._clients: Set[asyncio.StreamWriter] = set()
 
     async def handle_client(
         self,
         reader: asyncio.StreamReader,
         writer: asyncio.StreamWriter
     ) -> None:
-        """Handle a single client connection."""
+        """
+        Handle a client connection, serving requests until the client asks
+        to close or stays idle for KEEP_ALIVE_TIMEOUT seconds.
+        """
+        self._tune_socket(writer)
+        self._clients.add(writer)
+        timeout = 30.0
         try:
-            # Read request line
-            request_line = await asyncio.wait_for(
-                reader.readline(),
-                timeout=30.0
-            )
-            if not request_line:
-                return
-
-            request_line = request_line.decode('utf-8', errors='replace').strip()
-            parts = request_line.split(' ')
-            if len(parts) < 2:
-                return
-
-            method = parts[0]
-            path = parts[1].split('?')[0]  # Remove query string
-
-            # Read headers
-            headers = {}
             while True:
-                header_line = await asyncio.wait_for(
-                    reader.readline(),
-                    timeout=10.0
-                )
-                if not header_line or header_line == b'\r\n':
-                    break
-                header_line = header_line.decode('utf-8', errors='replace').strip()
-                if ':' in header_line:
-                    key, value = header_line.split(':', 1)
-                    headers[key.strip().lower()] = value.strip()
-
-            # Read body if present
-            body = b''
-            content_length = int(headers.get('content-length', 0))
-            if content_length > 0:
-                body = await asyncio.wait_for(
-                    reader.read(content_length),
-                    timeout=30.0
+                # Read the request line and headers in one go, up to the blank line
+                try:
+                    head = await asyncio.wait_for(
+                        reader.readuntil(b'\r\n\r\n'),
+                        timeout=timeout
+                    )
+                except asyncio.IncompleteReadError:
+                    return
+                except asyncio.LimitOverrunError:
+                    self._write_response(writer, 431, {}, b'', keep_alive=False)
+                    await writer.drain()
+                    return
+
+                request_line = head[:head.index(b'\r\n')]
+                method, sep, rest = request_line.decode('utf-8', errors='replace').strip().partition(' ')
+                if not sep:
+                    return
+
+                target, _, version = rest.partition(' ')
+                path = target.partition('?')[0]  # Remove query string
+                version = version or 'HTTP/1.0'
+
+                # Headers are decoded on lookup, not all up front
+                headers = _RequestHeaders(head)
+
+                # HTTP/1.1 defaults to keep-alive, HTTP/1.0 must ask for it
+                connection = headers.get('connection', '').lower()
+                if version == 'HTTP/1.1':
+                    keep_alive = 'close' not in connection
+                else:
+                    keep_alive = 'keep-alive' in connection
+
+                # Read body if present
+                body = b''
+                content_length = int(headers.get('content-length', 0))
+                if content_length > 0:
+                    body = await asyncio.wait_for(
+                        reader.readexactly(content_length),
+                        timeout=30.0
+                    )
+
+                # Handle the request
+                status_code, response_headers, response_body = await self.handler.handle_request(
+                    method, path, headers, body
                 )
 
-            # Handle the request
-            status_code, response_headers, response_body = await self.handler.handle_request(
-                method, path, headers, body
-            )
-
-            # Send response
-            status_text = {
-                200: 'OK',
-                404: 'Not Found',
-                500: 'Internal Server Error',
-            }.get(status_code, 'Unknown')
-
-            response_lines = [f'HTTP/1.1 {status_code} {status_text}']
-            response_headers['Content-Length'] = str(len(response_body))
-            response_headers['Connection'] = 'close'
-            response_headers['Access-Control-Allow-Origin'] = '*'
-
-            for key, value in response_headers.items():
-                response_lines.append(f'{key}: {value}')
-
-            response_lines.append('')
-            response_header = '\r\n'.join(response_lines) + '\r\n'
+                self._write_response(
+                    writer, status_code, response_headers, response_body, keep_alive
+                )
+                await writer.drain()
 
-            writer.write(response_header.encode('utf-8'))
-            writer.write(response_body)
-            await writer.drain()
+                if not keep_alive:
+                    return
+                timeout = KEEP_ALIVE_TIMEOUT
 
+        except asyncio.IncompleteReadError:
+            logger.debug("Client closed connection mid-request")
         except asyncio.TimeoutError:
             logger.debug("Client connection timeout")
         except ConnectionResetError:
@@ -395,26 +711,72 @@ class AsyncHTTPServer:
         except Exception as e:
             logger.error(f"Error handling client: {e}")
         finally:
+            self._clients.discard(writer)
             try:
                 writer.close()
                 await writer.wait_closed()
             except Exception:
                 pass
 
+    def _tune_socket(self, writer: asyncio.StreamWriter) -> None:
+        """
+        Disable Nagle and size the send buffer for a whole response, so
+        header and body leave in one go without a delayed-ACK stall.
+        """
+        sock = writer.get_extra_info('socket')
+        if sock is None or sock.family not in (socket.AF_INET, socket.AF_INET6):
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SEND_BUFFER_SIZE)
+        except OSError as e:
+            logger.debug(f"Could not set socket options: {e}")
+
+    @staticmethod
+    def _write_response(
+        writer: asyncio.StreamWriter,
+        status_code: int,
+        response_headers: Dict[str, str],
+        response_body: bytes,
+        keep_alive: bool = False
+    ) -> None:
+        """Write a response; the caller drains the writer."""
+        status_line = _STATUS_LINES.get(status_code)
+        if status_line is None:
+            status_line = f'HTTP/1.1 {status_code} Unknown\r\n'.encode('latin-1')
+
+        # A 304 has no body, and a Content-Length on it would have to match
+        # the full response (RFC 9110, 8.6), so send none
+        if status_code == 304:
+            content_length = b''
+        else:
+            content_length = b'Content-Length: %d\r\n' % len(response_body)
+
+        writer.writelines((
+            status_line,
+            _header_block(tuple(response_headers.items())),
+            content_length,
+            _KEEP_ALIVE_TAIL if keep_alive else _CLOSE_TAIL,
+            response_body,
+        ))
+
     async def start(self) -> asyncio.Server:
         """Start the HTTP server."""
         self._server = await asyncio.start_server(
             self.handle_client,
             self.host,
             self.port,
-            reuse_address=True
+            reuse_address=True,
+            reuse_port=self.reuse_port or None
         )
         return self._server
 
     def close(self) -> None:
-        """Close the server."""
+        """Close the server and any idle keep-alive connections."""
         if self._server:
             self._server.close()
+        for writer in list(self._clients):
+            writer.close()
 
     async def wait_closed(self) -> None:
         """Wait for server to close."""
@@ -427,7 +789,8 @@ async def create_http_server(
     port: int,
     status_gatherer: 'GASStatusGatherer',
     ws_manager: Optional['WebSocketManager'] = None,
-    frontend_dir: Optional[str] = None
+    frontend_dir: Optional[str] = None,
+    reuse_port: bool = False
 ) -> AsyncHTTPServer:
     """
     Create and start an HTTP server.
@@ -439,6 +802,6 @@ async def create_http_server(
         frontend_dir=frontend_dir
     )
 
-    server = AsyncHTTPServer(handler, host, port)
+    server = AsyncHTTPServer(handler, host, port, reuse_port=reuse_port)
     await server.start()
     return server
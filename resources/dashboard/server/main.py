@@ -5,12 +5,21 @@ GAS Dashboard Server - Main Entry Point
 Asyncio-based server with HTTP and WebSocket support for real-time streaming.
 """
 import asyncio
+import hashlib
+import json
+import os
 import signal
+import socket
 import logging
-from typing import Optional
+from typing import List, Optional
 from functools import partial
 
-from .config import PORT, HOST, GAS_NAME, FILE_WATCH_INTERVAL
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from .config import PORT, HOST, WORKERS, GAS_NAME, FILE_WATCH_INTERVAL
 from .http_handler import create_http_server, HTTPRequestHandler
 from .websocket_handler import WebSocketManager
 from .gas_status import GASStatusGatherer
@@ -28,15 +37,18 @@ class DashboardServer:
     Main server coordinating HTTP, WebSocket, and file watching.
     """
 
-    def __init__(self, host: str = HOST, port: int = PORT):
+    def __init__(self, host: str = HOST, port: int = PORT, reuse_port: bool = False):
         self.host = host
         self.port = port
+        # Share the ports with sibling worker processes
+        self.reuse_port = reuse_port
         self.ws_manager: Optional[WebSocketManager] = None
         self.status_gatherer: Optional[GASStatusGatherer] = None
         self.http_server = None
         self.ws_server = None
         self._shutdown_event: Optional[asyncio.Event] = None
         self._watch_task: Optional[asyncio.Task] = None
+        self._last_broadcast_hash: Optional[bytes] = None
 
     async def start(self) -> None:
         """Start all server components."""
@@ -53,13 +65,15 @@ class DashboardServer:
             host=self.host,
             port=self.port,
             status_gatherer=self.status_gatherer,
-            ws_manager=self.ws_manager
+            ws_manager=self.ws_manager,
+            reuse_port=self.reuse_port
         )
 
         # Create WebSocket server
         self.ws_server = await self.ws_manager.start_server(
             host=self.host,
-            port=self.port + 1  # WebSocket on port+1
+            port=self.port + 1,  # WebSocket on port+1
+            reuse_port=self.reuse_port
         )
 
         # Start file watching for status updates
@@ -70,14 +84,17 @@ class DashboardServer:
         logger.info("Dashboard is ready!")
 
     async def _watch_files(self) -> None:
-        """Watch for file changes and broadcast updates."""
+        """
+        Watch for file changes and broadcast updates.
+
+        All changes seen in one FILE_WATCH_INTERVAL produce at most one
+        status broadcast, and only when the status actually differs from
+        the last one sent.
+        """
         while not self._shutdown_event.is_set():
             try:
-                # Check for changes and broadcast if any
-                has_changes = await self.status_gatherer.check_for_changes()
-                if has_changes and self.ws_manager:
-                    status = await self.status_gatherer.get_full_status()
-                    await self.ws_manager.broadcast_status_update(status)
+                if await self.status_gatherer.check_for_changes() and self.ws_manager:
+                    await self._broadcast_status()
 
             except Exception as e:
                 logger.error(f"Error in file watcher: {e}")
@@ -91,6 +108,28 @@ class DashboardServer:
             except asyncio.TimeoutError:
                 pass  # Expected, continue watching
 
+    async def _broadcast_status(self) -> None:
+        """Serialize the full status once and broadcast it if it changed."""
+        status = await self.status_gatherer.get_full_status()
+
+        # The timestamp changes on every call: serialize everything else,
+        # hash those bytes, and splice the timestamp into the same payload
+        timestamp = status.get('timestamp')
+        data_json = self.ws_manager.encode_data(
+            {k: v for k, v in status.items() if k != 'timestamp'}
+        )
+        digest = hashlib.blake2b(data_json.encode(), digest_size=16).digest()
+        if digest == self._last_broadcast_hash:
+            return
+        self._last_broadcast_hash = digest
+
+        if timestamp is not None:
+            data_json = '%s%s"timestamp":%s}' % (
+                data_json[:-1], ',' if data_json != '{}' else '', json.dumps(timestamp)
+            )
+        message_json = self.ws_manager.wrap_encoded('status_update', data_json)
+        await self.ws_manager.broadcast_encoded('status_update', message_json)
+
     async def stop(self) -> None:
         """Gracefully stop all server components."""
         logger.info("Shutting down dashboard server...")
@@ -131,9 +170,9 @@ class DashboardServer:
             await self._shutdown_event.wait()
 
 
-async def main():
+async def main(reuse_port: bool = False):
     """Main entry point."""
-    server = DashboardServer()
+    server = DashboardServer(reuse_port=reuse_port)
 
     # Setup signal handlers for graceful shutdown
     loop = asyncio.get_running_loop()
@@ -160,15 +199,60 @@ async def main():
         await server.stop()
 
 
+def _fork_workers(count: int) -> List[int]:
+    """Fork worker processes; returns their pids in the parent, [] in a worker."""
+    pids = []
+    for _ in range(count):
+        pid = os.fork()
+        if pid == 0:
+            return []
+        pids.append(pid)
+    return pids
+
+
+def _stop_workers(pids: List[int]) -> None:
+    """Terminate forked workers and wait for them to exit."""
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    for pid in pids:
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            pass
+
+
 def run():
-    """Entry point for running as a script or module."""
+    """
+    Entry point for running as a script or module.
+    Uses the uvloop event loop when it is installed.
+
+    With WORKERS > 1, WORKERS - 1 extra processes are forked before any
+    event loop starts. All of them bind the HTTP and WebSocket ports with
+    SO_REUSEPORT and the kernel spreads connections across them, so
+    request handling is no longer limited to one core. Each worker
+    watches the files on its own.
+    """
+    workers = WORKERS
+    if workers > 1 and not (hasattr(socket, 'SO_REUSEPORT') and hasattr(os, 'fork')):
+        logger.warning("SO_REUSEPORT or fork() unavailable, running a single worker")
+        workers = 1
+    children = _fork_workers(workers - 1)
+
     try:
-        asyncio.run(main())
+        if uvloop is not None:
+            uvloop.run(main(reuse_port=workers > 1))
+        else:
+            asyncio.run(main(reuse_port=workers > 1))
     except KeyboardInterrupt:
         logger.info("Server interrupted by user")
     except Exception as e:
         logger.error(f"Server failed: {e}")
         raise
+    finally:
+        _stop_workers(children)
 
 
 if __name__ == '__main__':
@@ -8,25 +8,63 @@ Designed for efficient line-by-line parsing of Claude Code agent output.
 
 import json
 import re
+import sys
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Any, Optional, Set, Tuple, Union
 from datetime import datetime, timezone
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+
+# Fastest available decoder: orjson, then a reusable msgspec decoder,
+# then the stdlib. All accept str or bytes and raise ValueError subclasses.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    try:
+        import msgspec
+        _json_loads = msgspec.json.Decoder().decode
+    except ImportError:
+        _json_loads = json.loads
 
-from .config import COMPLETION_MARKERS, MAX_CONTENT_LENGTH, MAX_LIVE_EVENTS
+from .config import MAX_CONTENT_LENGTH, MAX_LIVE_EVENTS, scan_completion
 
 logger = logging.getLogger(__name__)
 
+# datetime.fromisoformat() accepts a trailing 'Z' from Python 3.11
+_FROMISOFORMAT_Z = sys.version_info >= (3, 11)
+
+# Event types format_event_for_display can produce content for. A tuple,
+# not a set: decoded 'type' values may be unhashable.
+_DISPLAYABLE_TYPES = ('tool_use', 'tool_result', 'assistant', 'text')
+
+# Event types whose text can announce that the agent finished
+_COMPLETION_TYPES = ('text', 'assistant', 'result')
+
+# Absolute path mentioned in a "Writing/Created/Edited/Modified ..." message
+_FILE_PATH_RE = re.compile(r'(?:Writing|Created|Edited|Modified).*?["\']?(/[^\s"\']+)["\']?')
+
 
-@dataclass
+def _json_dumps(data: Any) -> str:
+    """Serialize data to a JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data, default=str)
+
+
+@dataclass(slots=True)
 class ParsedOutput:
     """Structured output from parsing an agent's output file."""
     total_events: int = 0
     tools_used: Dict[str, int] = field(default_factory=dict)
+    total_tools_count: int = 0  # Running sum of tools_used values
     files_created: List[str] = field(default_factory=list)
     files_modified: List[str] = field(default_factory=list)
-    live_events: List[dict] = field(default_factory=list)
+    # Most recent MAX_LIVE_EVENTS events; older ones drop off in O(1)
+    live_events: Deque[dict] = field(default_factory=lambda: deque(maxlen=MAX_LIVE_EVENTS))
     last_activity: Optional[datetime] = None
+    last_activity_epoch: float = 0.0  # last_activity as UTC epoch seconds
     has_completion_marker: bool = False
     progress_estimate: int = 0
     current_task: str = ''
@@ -34,21 +72,92 @@ class ParsedOutput:
     raw_lines_count: int = 0
     assistant_messages: int = 0
     tool_results: int = 0
-
-
-def parse_ndjson_line(line: str) -> Optional[dict]:
-    """Parse a single NDJSON line, handling malformed JSON gracefully."""
+    # Formatted last_activity, reused until last_activity changes
+    _iso_source: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    _iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # Membership sets backing files_created / files_modified
+    _created_set: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _modified_set: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Results rebuilt from the parse cache pass plain lists
+        if not isinstance(self.live_events, deque):
+            self.live_events = deque(self.live_events, maxlen=MAX_LIVE_EVENTS)
+        self._created_set = set(self.files_created)
+        self._modified_set = set(self.files_modified)
+        if not self.total_tools_count and self.tools_used:
+            self.total_tools_count = sum(self.tools_used.values())
+
+    def copy(self) -> 'ParsedOutput':
+        """Return a copy whose containers can be updated without touching this one."""
+        return replace(
+            self,
+            tools_used=dict(self.tools_used),
+            files_created=list(self.files_created),
+            files_modified=list(self.files_modified),
+            live_events=deque(self.live_events, maxlen=MAX_LIVE_EVENTS),
+            errors=list(self.errors),
+        )
+
+    def add_file_created(self, file_path: str) -> None:
+        """Record a created file once, keeping first-seen order."""
+        if file_path not in self._created_set:
+            self._created_set.add(file_path)
+            self.files_created.append(file_path)
+
+    def add_file_modified(self, file_path: str) -> None:
+        """Record a modified file once, keeping first-seen order."""
+        if file_path not in self._modified_set:
+            self._modified_set.add(file_path)
+            self.files_modified.append(file_path)
+
+    def last_activity_iso(self) -> Optional[str]:
+        """Return last_activity as an ISO 8601 string with a 'Z' suffix."""
+        if not self.last_activity:
+            return None
+        if self._iso_source is not self.last_activity:
+            self._iso = self.last_activity.isoformat() + 'Z'
+            self._iso_source = self.last_activity
+        return self._iso
+
+
+def parse_ndjson_line(line: Union[str, bytes]) -> Optional[dict]:
+    """
+    Parse a single NDJSON line, handling malformed JSON gracefully.
+    Accepts str or raw bytes; uses orjson or msgspec when available.
+    """
     line = line.strip()
     if not line:
         return None
 
+    # Events are JSON objects; reject anything else by its first byte
+    # instead of paying for a failed decode on plain-text log lines
+    if not line.startswith(b'{' if isinstance(line, bytes) else '{'):
+        return None
+
     try:
-        return json.loads(line)
-    except json.JSONDecodeError:
+        return _json_loads(line)
+    except ValueError:
         # Try to extract partial info from malformed lines
         return None
 
 
+def iter_ndjson_lines(content: Union[str, bytes]) -> Iterator[Union[str, bytes]]:
+    """
+    Yield the lines of NDJSON content lazily, without building a list.
+    Newlines are located with find(), which scans in C (memchr for bytes).
+    """
+    newline = b'\n' if isinstance(content, (bytes, bytearray)) else '\n'
+    start = 0
+    while True:
+        end = content.find(newline, start)
+        if end < 0:
+            yield content[start:]
+            return
+        yield content[start:end]
+        start = end + 1
+
+
 def extract_tool_name(event: dict) -> Optional[str]:
     """Extract tool name from various event formats."""
     # Standard format
@@ -83,6 +192,35 @@ def extract_tool_name(event: dict) -> Optional[str]:
     return None
 
 
+def _append_tool_uses(content: Any, tools: List[Tuple[str, Optional[dict]]]) -> None:
+    """Append (tool_name, input_data) for each tool_use item in a content list."""
+    if isinstance(content, list):
+        for item in content:
+            if isinstance(item, dict) and item.get('type') == 'tool_use':
+                tools.append((item.get('name', 'unknown'), item.get('input')))
+
+
+def _tools_from_tool_use(event: dict, tools: List[Tuple[str, Optional[dict]]]) -> None:
+    """Direct tool_use event."""
+    tools.append((event.get('name', 'unknown'), event.get('input')))
+
+
+def _tools_from_assistant(event: dict, tools: List[Tuple[str, Optional[dict]]]) -> None:
+    """Assistant message; tool_use items may be in content or message.content."""
+    _append_tool_uses(event.get('content', []), tools)
+
+    msg = event.get('message')
+    if isinstance(msg, dict):
+        _append_tool_uses(msg.get('content'), tools)
+
+
+# Tool extractors by event type; other types carry no tool usages
+_TOOL_EXTRACTORS = {
+    'tool_use': _tools_from_tool_use,
+    'assistant': _tools_from_assistant,
+}
+
+
 def extract_all_tools_from_event(event: dict) -> List[Tuple[str, Optional[dict]]]:
     """
     Extract all tool usages from an event (handles multiple tools in one message).
@@ -90,28 +228,11 @@ def extract_all_tools_from_event(event: dict) -> List[Tuple[str, Optional[dict]]
     """
     tools = []
 
-    # Direct tool_use event
-    if event.get('type') == 'tool_use':
-        tools.append((event.get('name', 'unknown'), event.get('input')))
-        return tools
-
-    # Check assistant message content for multiple tool_use items
-    if event.get('type') == 'assistant':
-        content = event.get('content', [])
-        if isinstance(content, list):
-            for item in content:
-                if isinstance(item, dict) and item.get('type') == 'tool_use':
-                    tools.append((item.get('name', 'unknown'), item.get('input')))
-
-        # Also check nested message format
-        if 'message' in event:
-            msg = event['message']
-            if isinstance(msg, dict) and 'content' in msg:
-                msg_content = msg['content']
-                if isinstance(msg_content, list):
-                    for item in msg_content:
-                        if isinstance(item, dict) and item.get('type') == 'tool_use':
-                            tools.append((item.get('name', 'unknown'), item.get('input')))
+    event_type = event.get('type')
+    if isinstance(event_type, str):
+        extractor = _TOOL_EXTRACTORS.get(event_type)
+        if extractor is not None:
+            extractor(event, tools)
 
     return tools
 
@@ -127,20 +248,32 @@ def extract_file_path(event: dict) -> Optional[str]:
         content = event['content']
         if isinstance(content, str):
             # Look for file paths in content
-            match = re.search(r'(?:Writing|Created|Edited|Modified).*?["\']?(/[^\s"\']+)["\']?', content)
+            match = _FILE_PATH_RE.search(content)
             if match:
                 return match.group(1)
 
     return None
 
 
-def check_completion_markers(text: str) -> bool:
+def check_completion_markers(text: Union[str, bytes]) -> bool:
     """Check if text contains any completion marker."""
-    text_lower = text.lower()
-    for marker in COMPLETION_MARKERS:
-        if marker.lower() in text_lower:
-            return True
-    return False
+    return scan_completion(text) is not None
+
+
+def _completion_texts(event: dict) -> Iterator[str]:
+    """Yield the text payloads of an event that completion markers apply to."""
+    for key in ('text', 'content', 'result'):
+        value = event.get(key)
+        if isinstance(value, str):
+            yield value
+
+    # Assistant text blocks, at the top level or inside the message
+    message = event.get('message')
+    for blocks in (event.get('content'), message.get('content') if isinstance(message, dict) else None):
+        if isinstance(blocks, list):
+            for block in blocks:
+                if isinstance(block, dict) and isinstance(block.get('text'), str):
+                    yield block['text']
 
 
 def format_event_for_display(event: dict, max_length: int = MAX_CONTENT_LENGTH) -> dict:
@@ -183,7 +316,7 @@ def format_event_for_display(event: dict, max_length: int = MAX_CONTENT_LENGTH)
             if isinstance(content, str):
                 formatted['content'] = content[:max_length]
             elif isinstance(content, dict):
-                formatted['content'] = json.dumps(content)[:max_length]
+                formatted['content'] = _json_dumps(content)[:max_length]
             else:
                 formatted['content'] = str(content)[:max_length]
 
@@ -209,33 +342,44 @@ def format_event_for_display(event: dict, max_length: int = MAX_CONTENT_LENGTH)
     return formatted
 
 
-def parse_output_content(content: str, existing_parsed: Optional[ParsedOutput] = None) -> ParsedOutput:
+def parse_output_content(
+    content: Union[str, bytes],
+    existing_parsed: Optional[ParsedOutput] = None
+) -> ParsedOutput:
     """
     Parse output content (NDJSON format) and extract structured information.
     Can be used incrementally by passing existing_parsed.
 
-    Uses line-by-line parsing for memory efficiency.
+    Accepts str or raw bytes; lines are produced lazily for memory efficiency.
     """
     result = existing_parsed or ParsedOutput()
 
-    lines = content.split('\n')
-    result.raw_lines_count += len(lines)
+    newline = b'\n' if isinstance(content, (bytes, bytearray)) else '\n'
+    result.raw_lines_count += content.count(newline) + 1
 
-    for line in lines:
+    last_timestamp = None
+    for line in iter_ndjson_lines(content):
         event = parse_ndjson_line(line)
         if not event:
             continue
 
         result.total_events += 1
 
-        # Update last activity timestamp
+        # Update last activity timestamp; consecutive events often repeat
+        # the same string, which cannot move last_activity again
         timestamp = event.get('timestamp')
-        if timestamp:
+        if timestamp and timestamp != last_timestamp:
+            last_timestamp = timestamp
             try:
                 if isinstance(timestamp, str):
-                    ts = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    if not result.last_activity or ts > result.last_activity:
+                    if not _FROMISOFORMAT_Z and timestamp.endswith('Z'):
+                        timestamp = timestamp[:-1] + '+00:00'
+                    ts = datetime.fromisoformat(timestamp)
+                    # Naive timestamps are UTC
+                    epoch = (ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)).timestamp()
+                    if not result.last_activity or epoch > result.last_activity_epoch:
                         result.last_activity = ts
+                        result.last_activity_epoch = epoch
             except (ValueError, AttributeError):
                 pass
 
@@ -246,10 +390,17 @@ def parse_output_content(content: str, existing_parsed: Optional[ParsedOutput] =
         elif event_type == 'tool_result':
             result.tool_results += 1
 
+        # Check only text payloads for completion markers: plain log lines
+        # and tool output that mention a marker don't finish the agent
+        if (not result.has_completion_marker and event_type in _COMPLETION_TYPES
+                and any(check_completion_markers(text) for text in _completion_texts(event))):
+            result.has_completion_marker = True
+
         # Extract all tools from event (handles multiple tools per message)
         tools = extract_all_tools_from_event(event)
         for tool_name, input_data in tools:
             result.tools_used[tool_name] = result.tools_used.get(tool_name, 0) + 1
+            result.total_tools_count += 1
 
             # Extract file operations from tool input
             if tool_name in ('Write', 'Edit', 'NotebookEdit') and input_data:
@@ -257,10 +408,10 @@ def parse_output_content(content: str, existing_parsed: Optional[ParsedOutput] =
                 if isinstance(input_data, dict):
                     file_path = input_data.get('file_path') or input_data.get('notebook_path')
                 if file_path:
-                    if tool_name == 'Write' and file_path not in result.files_created:
-                        result.files_created.append(file_path)
-                    elif tool_name == 'Edit' and file_path not in result.files_modified:
-                        result.files_modified.append(file_path)
+                    if tool_name == 'Write':
+                        result.add_file_created(file_path)
+                    elif tool_name == 'Edit':
+                        result.add_file_modified(file_path)
 
             # Extract current task from TodoWrite
             if tool_name == 'TodoWrite' and input_data:
@@ -275,19 +426,15 @@ def parse_output_content(content: str, existing_parsed: Optional[ParsedOutput] =
             tool_name = extract_tool_name(event)
             if tool_name:
                 result.tools_used[tool_name] = result.tools_used.get(tool_name, 0) + 1
+                result.total_tools_count += 1
                 # Extract file operations
                 if tool_name in ('Write', 'Edit', 'NotebookEdit'):
                     file_path = extract_file_path(event)
                     if file_path:
-                        if tool_name == 'Write' and file_path not in result.files_created:
-                            result.files_created.append(file_path)
-                        elif tool_name == 'Edit' and file_path not in result.files_modified:
-                            result.files_modified.append(file_path)
-
-        # Check for completion markers
-        event_str = json.dumps(event)
-        if check_completion_markers(event_str):
-            result.has_completion_marker = True
+                        if tool_name == 'Write':
+                            result.add_file_created(file_path)
+                        elif tool_name == 'Edit':
+                            result.add_file_modified(file_path)
 
         # Check for errors
         if event.get('type') == 'error' or event.get('is_error'):
@@ -295,12 +442,12 @@ def parse_output_content(content: str, existing_parsed: Optional[ParsedOutput] =
             if isinstance(error_msg, str) and len(error_msg) < 200:
                 result.errors.append(error_msg[:200])
 
-        # Add to live events (keep most recent)
-        formatted = format_event_for_display(event)
-        if formatted['content']:  # Only add if has content
-            result.live_events.append(formatted)
-            if len(result.live_events) > MAX_LIVE_EVENTS:
-                result.live_events.pop(0)
+        # Add to live events (keep most recent); other event types always
+        # format to empty content, so skip building them
+        if event_type in _DISPLAYABLE_TYPES:
+            formatted = format_event_for_display(event)
+            if formatted['content']:  # Only add if has content
+                result.live_events.append(formatted)
 
     # Estimate progress based on events and tool usage
     result.progress_estimate = estimate_progress(result)
@@ -317,7 +464,7 @@ def estimate_progress(parsed: ParsedOutput) -> int:
         return 100
 
     # Base progress on total tool usage
-    total_tools = sum(parsed.tools_used.values())
+    total_tools = parsed.total_tools_count
     progress = min(60, total_tools * 3)
 
     # Boost for file creation (indicates concrete work)
@@ -335,9 +482,12 @@ def estimate_progress(parsed: ParsedOutput) -> int:
 
 
 def parse_output_file(file_path: str) -> ParsedOutput:
-    """Parse an entire output file."""
+    """
+    Parse an entire output file.
+    The file is read as bytes; the JSON decoder handles UTF-8 itself.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        with open(file_path, 'rb') as f:
             content = f.read()
         return parse_output_content(content)
     except Exception as e:
@@ -364,44 +514,32 @@ def parse_incremental(file_path: str, tracker: Any, cache: Any) -> ParsedOutput:
     if not os.path.exists(file_path):
         return ParsedOutput()
 
-    # Check cache first
-    mtime = os.path.getmtime(file_path)
-    cached = cache.get_with_mtime(file_path, mtime)
-    if cached:
-        return ParsedOutput(**cached)
+    from .file_tracker import read_file_head
+
+    # Check cache first, keyed on content so mtime-only bumps still hit.
+    # Results are cached as ParsedOutput instances and shared with callers;
+    # use to_dict() for a serializable copy.
+    size, head = read_file_head(file_path)
+    cached = cache.get_with_content_hash(file_path, size, head)
+    if cached is not None:
+        return cached
 
     # Get new content since last read
     new_content, has_new = tracker.get_new_content(file_path)
 
     # If no new content, try to return existing cached result
     if not has_new:
-        # Return from cache with any mtime
-        for key in list(cache._cache.keys()):
-            if key.startswith(f"{file_path}:"):
-                data = cache._cache[key]
-                return ParsedOutput(**data)
+        # Return the latest cached result for this file, whatever its key
+        cached = cache.get_latest(file_path)
+        if cached is not None:
+            return cached
         # No cache, parse entire file
         result = parse_output_file(file_path)
     else:
         # Parse new content incrementally
         result = parse_output_content(new_content)
 
-    # Cache result
-    cache.set_with_mtime(file_path, mtime, {
-        'total_events': result.total_events,
-        'tools_used': result.tools_used,
-        'files_created': result.files_created,
-        'files_modified': result.files_modified,
-        'live_events': result.live_events,
-        'last_activity': result.last_activity.isoformat() if result.last_activity else None,
-        'has_completion_marker': result.has_completion_marker,
-        'progress_estimate': result.progress_estimate,
-        'current_task': result.current_task,
-        'errors': result.errors,
-        'raw_lines_count': result.raw_lines_count,
-        'assistant_messages': result.assistant_messages,
-        'tool_results': result.tool_results
-    })
+    cache.set_with_content_hash(file_path, size, head, result)
 
     return result
 
@@ -413,7 +551,7 @@ def to_dict(parsed: ParsedOutput) -> dict:
         'tools_used': parsed.tools_used,
         'files_created': parsed.files_created,
         'files_modified': parsed.files_modified,
-        'live_events': parsed.live_events,
+        'live_events': list(parsed.live_events),
         'last_activity': parsed.last_activity.isoformat() if parsed.last_activity else None,
         'has_completion_marker': parsed.has_completion_marker,
         'progress_estimate': parsed.progress_estimate,
@@ -442,7 +580,7 @@ def get_activity_summary(parsed: ParsedOutput) -> str:
             content = last_event['content'][:80]
             return f"{content}..." if len(last_event['content']) > 80 else content
 
-    total_tools = sum(parsed.tools_used.values())
+    total_tools = parsed.total_tools_count
     if total_tools > 0:
         return f"Working... ({total_tools} tool calls)"
 
@@ -7,8 +7,9 @@ WebSocket connection management for real-time streaming updates.
 import asyncio
 import json
 import logging
+from collections import defaultdict
 from datetime import datetime
-from typing import Set, Dict, Any, Optional, TYPE_CHECKING
+from typing import DefaultDict, FrozenSet, Iterable, List, Set, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
 
 try:
@@ -21,7 +22,14 @@ except ImportError:
     WebSocketServerProtocol = None
     ConnectionClosed = Exception
 
-from .config import WEBSOCKET_PING_INTERVAL
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+from .config import WEBSOCKET_PING_INTERVAL, BROADCAST_BATCH_SIZE
 
 if TYPE_CHECKING:
     from .gas_status import GASStatusGatherer
@@ -29,9 +37,31 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _dumps_message(message: Dict[str, Any]) -> str:
+    """
+    Serialize a message for a text frame, using orjson when available.
+    Non-string keys (wave numbers) and datetimes are handled like
+    json.dumps(default=str).
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            message,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        ).decode('utf-8')
+    return json.dumps(message, default=str)
+
+
+def _event_names(events: Any) -> Optional[Set[str]]:
+    """Return a client-sent event list as a set, or None unless it is a list of strings."""
+    if not isinstance(events, list) or not all(isinstance(e, str) for e in events):
+        return None
+    return set(events)
+
+
+@dataclass(slots=True, eq=False)
 class WebSocketConnection:
-    """Track state for a single WebSocket connection."""
+    """Track state for a single WebSocket connection (hashed by identity)."""
     websocket: Any
     connected_at: datetime = field(default_factory=datetime.utcnow)
     last_ping: Optional[datetime] = None
@@ -47,6 +77,8 @@ class WebSocketManager:
     def __init__(self, status_gatherer: 'GASStatusGatherer'):
         self.status_gatherer = status_gatherer
         self._connections: Set[WebSocketConnection] = set()
+        # Connections by subscribed message type, so broadcasts skip the rest
+        self._subs_by_type: DefaultDict[str, Set[WebSocketConnection]] = defaultdict(set)
         self._lock = asyncio.Lock()
         self._server = None
         self._ping_task: Optional[asyncio.Task] = None
@@ -57,8 +89,8 @@ class WebSocketManager:
         """Get the number of active connections."""
         return len(self._connections)
 
-    async def start_server(self, host: str, port: int) -> Any:
-        """Start the WebSocket server."""
+    async def start_server(self, host: str, port: int, reuse_port: bool = False) -> Any:
+        """Start the WebSocket server; reuse_port lets worker processes share the port."""
         if not WEBSOCKETS_AVAILABLE:
             logger.warning("websockets library not available, WebSocket server disabled")
             return None
@@ -69,12 +101,16 @@ class WebSocketManager:
             port,
             ping_interval=WEBSOCKET_PING_INTERVAL,
             ping_timeout=WEBSOCKET_PING_INTERVAL * 2,
+            # Per-connection deflate would recompress every broadcast once
+            # per client; send the shared payload uncompressed instead.
+            compression=None,
+            reuse_port=reuse_port or None,
         )
 
         # Start ping task to keep connections alive
         self._ping_task = asyncio.create_task(self._ping_connections())
 
-        logger.info(f"WebSocket server started on ws://{host}:{port}")
+        logger.info("WebSocket server started on ws://%s:%s", host, port)
         return self._server
 
     async def _handle_connection(self, websocket: WebSocketServerProtocol) -> None:
@@ -86,8 +122,9 @@ class WebSocketManager:
                 client_id=f"client_{self._connection_id_counter}"
             )
             self._connections.add(conn)
+            self._subscribe(conn, conn.subscriptions)
 
-        logger.info(f"WebSocket client connected: {conn.client_id} (total: {len(self._connections)})")
+        logger.info("WebSocket client connected: %s (total: %s)", conn.client_id, len(self._connections))
 
         try:
             # Send initial status
@@ -98,44 +135,64 @@ class WebSocketManager:
                 await self._handle_message(conn, message)
 
         except ConnectionClosed:
-            logger.info(f"WebSocket client disconnected: {conn.client_id}")
+            logger.info("WebSocket client disconnected: %s", conn.client_id)
         except Exception as e:
-            logger.error(f"WebSocket error for {conn.client_id}: {e}")
+            logger.error("WebSocket error for %s: %s", conn.client_id, e)
         finally:
             async with self._lock:
                 self._connections.discard(conn)
+                self._unsubscribe(conn, conn.subscriptions)
+
+    def _subscribe(self, conn: WebSocketConnection, events: Iterable[str]) -> None:
+        """Add a connection to the subscriber sets of the given message types."""
+        for event in events:
+            self._subs_by_type[event].add(conn)
+
+    def _unsubscribe(self, conn: WebSocketConnection, events: Iterable[str]) -> None:
+        """Remove a connection from the subscriber sets of the given message types."""
+        for event in events:
+            subscribers = self._subs_by_type.get(event)
+            if subscribers is not None:
+                subscribers.discard(conn)
+                if not subscribers:
+                    del self._subs_by_type[event]
 
     async def _send_initial_status(self, conn: WebSocketConnection) -> None:
         """Send initial status to a newly connected client."""
         try:
             status = await self.status_gatherer.get_full_status()
             message = self._create_message('status_update', status)
-            await conn.websocket.send(json.dumps(message))
+            await conn.websocket.send(_dumps_message(message))
         except Exception as e:
-            logger.error(f"Error sending initial status: {e}")
+            logger.error("Error sending initial status: %s", e)
 
     async def _handle_message(self, conn: WebSocketConnection, message: str) -> None:
         """Handle an incoming message from a client."""
         try:
-            data = json.loads(message)
+            data = _json_loads(message)
             msg_type = data.get('type', '')
 
             if msg_type == 'subscribe':
-                # Subscribe to specific event types
-                events = data.get('events', [])
+                # Subscribe to specific event types; build the new set before
+                # touching the index, so bad input leaves the old one intact
+                events = _event_names(data.get('events', []))
                 if events:
-                    conn.subscriptions = set(events)
-                    logger.debug(f"Client {conn.client_id} subscribed to: {events}")
+                    self._unsubscribe(conn, conn.subscriptions)
+                    conn.subscriptions = events
+                    self._subscribe(conn, conn.subscriptions)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Client %s subscribed to: %s", conn.client_id, events)
 
             elif msg_type == 'unsubscribe':
                 # Unsubscribe from event types
-                events = data.get('events', [])
-                for event in events:
-                    conn.subscriptions.discard(event)
+                events = _event_names(data.get('events', []))
+                if events:
+                    self._unsubscribe(conn, events)
+                    conn.subscriptions.difference_update(events)
 
             elif msg_type == 'ping':
                 # Respond to ping
-                await conn.websocket.send(json.dumps({
+                await conn.websocket.send(_dumps_message({
                     'type': 'pong',
                     'timestamp': datetime.utcnow().isoformat() + 'Z'
                 }))
@@ -154,12 +211,12 @@ class WebSocketManager:
                             'agent_id': agent_id,
                             'data': agent_data
                         })
-                        await conn.websocket.send(json.dumps(message))
+                        await conn.websocket.send(_dumps_message(message))
 
         except json.JSONDecodeError:
-            logger.warning(f"Invalid JSON from {conn.client_id}: {message[:100]}")
+            logger.warning("Invalid JSON from %s: %s", conn.client_id, message[:100])
         except Exception as e:
-            logger.error(f"Error handling message from {conn.client_id}: {e}")
+            logger.error("Error handling message from %s: %s", conn.client_id, e)
 
     def _create_message(self, msg_type: str, data: Any) -> Dict[str, Any]:
         """Create a standardized message format."""
@@ -169,32 +226,81 @@ class WebSocketManager:
             'timestamp': datetime.utcnow().isoformat() + 'Z'
         }
 
+    def encode_message(self, msg_type: str, data: Any) -> str:
+        """Create a standardized message and serialize it for sending."""
+        return _dumps_message(self._create_message(msg_type, data))
+
+    def encode_data(self, data: Any) -> str:
+        """Serialize a message payload on its own, for wrap_encoded()."""
+        return _dumps_message(data)
+
+    def wrap_encoded(self, msg_type: str, data_json: str) -> str:
+        """Wrap an already serialized payload in the standard message format."""
+        return '{"type":%s,"data":%s,"timestamp":"%sZ"}' % (
+            json.dumps(msg_type), data_json, datetime.utcnow().isoformat()
+        )
+
     async def broadcast(self, msg_type: str, data: Any) -> None:
-        """Broadcast a message to all connected clients."""
+        """
+        Broadcast a message to all connected clients.
+
+        The message is serialized once and handed to websockets.broadcast(),
+        which encodes it once and writes the same payload to every
+        connection without awaiting each client in turn.
+        """
         if not self._connections:
             return
 
-        message = self._create_message(msg_type, data)
-        message_json = json.dumps(message)
+        await self.broadcast_encoded(msg_type, self.encode_message(msg_type, data))
+
+    async def broadcast_encoded(self, msg_type: str, message_json: str) -> None:
+        """Broadcast an already serialized message to subscribed clients."""
+        if not self._connections:
+            return
 
         async with self._lock:
-            to_remove = set()
-            for conn in self._connections:
-                # Check if client is subscribed to this message type
-                if msg_type not in conn.subscriptions:
-                    continue
+            recipients = [conn.websocket for conn in self._subs_by_type.get(msg_type, ())]
+
+        for start in range(0, len(recipients), BROADCAST_BATCH_SIZE):
+            if start:
+                # Let other tasks run between batches
+                await asyncio.sleep(0)
+            # Closed connections are skipped here and removed by their handler
+            websockets.broadcast(recipients[start:start + BROADCAST_BATCH_SIZE], message_json)
+
+    async def broadcast_batch(self, frames: List[Tuple[str, Any]]) -> None:
+        """
+        Broadcast several messages as one 'batch' frame per client.
+
+        Each client receives only the frames it subscribes to. Clients with
+        the same selection share one serialized payload; a selection of a
+        single frame is sent as a plain message.
+        """
+        if not self._connections or not frames:
+            return
 
-                try:
-                    await conn.websocket.send(message_json)
-                except ConnectionClosed:
-                    to_remove.add(conn)
-                except Exception as e:
-                    logger.error(f"Error broadcasting to {conn.client_id}: {e}")
-                    to_remove.add(conn)
-
-            # Remove dead connections
-            for conn in to_remove:
-                self._connections.discard(conn)
+        async with self._lock:
+            groups: Dict[FrozenSet[int], List[Any]] = defaultdict(list)
+            for conn in self._connections:
+                selected = frozenset(
+                    i for i, (msg_type, _) in enumerate(frames)
+                    if msg_type in conn.subscriptions
+                )
+                if selected:
+                    groups[selected].append(conn.websocket)
+
+        messages = [self._create_message(msg_type, data) for msg_type, data in frames]
+        for selected, recipients in groups.items():
+            if len(selected) == 1:
+                payload = _dumps_message(messages[next(iter(selected))])
+            else:
+                payload = _dumps_message(self._create_message(
+                    'batch', [messages[i] for i in sorted(selected)]
+                ))
+            for start in range(0, len(recipients), BROADCAST_BATCH_SIZE):
+                if start:
+                    await asyncio.sleep(0)
+                websockets.broadcast(recipients[start:start + BROADCAST_BATCH_SIZE], payload)
 
     async def broadcast_status_update(self, status: Dict[str, Any]) -> None:
         """Broadcast a status update to all clients."""
@@ -222,7 +328,7 @@ class WebSocketManager:
                     for conn in self._connections:
                         try:
                             # Send ping
-                            await conn.websocket.send(json.dumps({
+                            await conn.websocket.send(_dumps_message({
                                 'type': 'ping',
                                 'timestamp': datetime.utcnow().isoformat() + 'Z'
                             }))
@@ -230,16 +336,17 @@ class WebSocketManager:
                         except ConnectionClosed:
                             to_remove.add(conn)
                         except Exception as e:
-                            logger.error(f"Error pinging {conn.client_id}: {e}")
+                            logger.error("Error pinging %s: %s", conn.client_id, e)
                             to_remove.add(conn)
 
                     for conn in to_remove:
                         self._connections.discard(conn)
+                        self._unsubscribe(conn, conn.subscriptions)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Error in ping task: {e}")
+                logger.error("Error in ping task: %s", e)
 
     async def close_all(self) -> None:
         """Close all WebSocket connections."""
@@ -257,6 +364,7 @@ class WebSocketManager:
                 except Exception:
                     pass
             self._connections.clear()
+            self._subs_by_type.clear()
 
         logger.info("All WebSocket connections closed")
 
@@ -286,17 +394,15 @@ class FileChangeNotifier:
                 has_changes = await self.status_gatherer.check_for_changes()
 
                 if has_changes:
-                    # Get updated status and broadcast
+                    # Send the status and any new live events as one batch
                     status = await self.status_gatherer.get_full_status()
-                    await self.ws_manager.broadcast_status_update(status)
-
-                    # Get and broadcast any new live events
+                    frames = [('status_update', status)]
                     events = await self.status_gatherer.get_new_events()
-                    for event in events:
-                        await self.ws_manager.broadcast_live_event(event)
+                    frames.extend(('live_event', event) for event in events)
+                    await self.ws_manager.broadcast_batch(frames)
 
             except Exception as e:
-                logger.error(f"Error in file change notifier: {e}")
+                logger.error("Error in file change notifier: %s", e)
 
             await asyncio.sleep(interval)
 
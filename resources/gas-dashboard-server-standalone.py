@@ -14,14 +14,32 @@ Self-contained dashboard server combining:
 import os
 import sys
 import json
+import re
 import signal
 import logging
 import glob
+import gzip
+import hashlib
 from datetime import datetime, timezone
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse
 from typing import Dict, List, Optional, Any, Tuple
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import csscompressor
+except ImportError:
+    csscompressor = None
+
+try:
+    import htmlmin
+except ImportError:
+    htmlmin = None
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -30,6 +48,8 @@ GAS_DIR = os.getenv('GAS_DIR', '/workspace/project-gas')
 GAS_NAME = os.getenv('GAS_NAME', 'GAS Task')
 GAS_MODE = os.getenv('GAS_MODE', 'swarm')
 PORT = int(os.getenv('GAS_PORT', '8080'))
+# Serve the page and stylesheets unminified, as written
+DEBUG = os.getenv('GAS_DEBUG', '0') == '1'
 
 IDLE_THRESHOLD_SECONDS = 60
 COMPLETION_THRESHOLD_SECONDS = 120
@@ -63,7 +83,7 @@ COMPLETION_MARKERS = [
 # Embedded Dashboard HTML (Capybara-inspired design from swarm-dashboard v6)
 # =============================================================================
 
-DASHBOARD_HTML = '''<!DOCTYPE html>
+_DASHBOARD_HTML_HEAD = '''<!DOCTYPE html>
 <html lang="en" data-theme="light">
 <head>
   <meta charset="UTF-8">
@@ -72,8 +92,11 @@ DASHBOARD_HTML = '''<!DOCTYPE html>
   <link rel="preconnect" href="https://fonts.googleapis.com">
   <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
   <link href="https://fonts.googleapis.com/css2?family=Instrument+Serif:ital@0;1&family=Courier+Prime:wght@400;700&display=swap" rel="stylesheet">
-  <style>
-/* ==============================================
+'''
+
+# Stylesheet source. It is served as one flat stylesheet per theme (see
+# _resolve_theme_css) under content-hashed URLs, cached apart from the page
+DASHBOARD_CSS = '''/* ==============================================
    GAS Dashboard CSS - Extracted from Swarm Dashboard v6
    with Capybara-Inspired Color Palette
    ============================================== */
@@ -1500,8 +1523,9 @@ h1, h2, h3, h4 {
     height: 12px;
   }
 }
-  </style>
-</head>
+'''
+
+_DASHBOARD_HTML_TAIL = '''</head>
 <body class="no-theme-transition">
   <div class="app" id="app">
     <!-- Main Panel -->
@@ -1673,6 +1697,8 @@ h1, h2, h3, h4 {
 let gasData = null;
 let selectedAgent = null;
 let connectionOk = false;
+// Markup last written to each container, so unchanged polls skip the DOM
+const renderedHtml = new WeakMap();
 
 // =============================================================================
 // Theme Toggle
@@ -1680,12 +1706,23 @@ let connectionOk = false;
 
 const themeToggle = document.getElementById('theme-toggle');
 const html = document.documentElement;
+const themeStylesheets = {
+  light: document.getElementById('theme-light'),
+  dark: document.getElementById('theme-dark'),
+};
+
+// Each theme has its own pre-resolved stylesheet; enable only the active one
+function setThemeStylesheet(theme) {
+  themeStylesheets.light.media = theme === 'dark' ? 'not all' : 'all';
+  themeStylesheets.dark.media = theme === 'dark' ? 'all' : 'not all';
+}
 
 function initTheme() {
   const savedTheme = localStorage.getItem('gas-theme');
   const prefersDark = window.matchMedia('(prefers-color-scheme: dark)').matches;
   const theme = savedTheme || (prefersDark ? 'dark' : 'light');
   html.setAttribute('data-theme', theme);
+  setThemeStylesheet(theme);
   updateThemeIcon(theme);
 }
 
@@ -1714,6 +1751,7 @@ themeToggle.addEventListener('click', () => {
   const currentTheme = html.getAttribute('data-theme');
   const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
   html.setAttribute('data-theme', newTheme);
+  setThemeStylesheet(newTheme);
   localStorage.setItem('gas-theme', newTheme);
   updateThemeIcon(newTheme);
 });
@@ -1751,6 +1789,14 @@ function escapeHtml(text) {
   return div.innerHTML;
 }
 
+function setHtml(container, markup) {
+  // Rewriting identical markup still rebuilds the subtree and forces
+  // style recalc and layout, and it resets scroll positions
+  if (renderedHtml.get(container) === markup) return;
+  renderedHtml.set(container, markup);
+  container.innerHTML = markup;
+}
+
 // =============================================================================
 // Connection Status
 // =============================================================================
@@ -1852,17 +1898,17 @@ function updateSuccessionList(successions) {
   const container = document.getElementById('succession-list');
 
   if (!successions || successions.length === 0) {
-    container.innerHTML = '<p class="empty-state-small">No successions yet</p>';
+    setHtml(container, '<p class="empty-state-small">No successions yet</p>');
     return;
   }
 
-  container.innerHTML = successions.slice(-10).reverse().map(s => `
+  setHtml(container, successions.slice(-10).reverse().map(s => `
     <div class="succession-item">
       <span class="succession-agent">${escapeHtml(s.agent)}</span>
       <span class="succession-arrow">G${s.from_gen} &rarr; G${s.to_gen}</span>
       <span class="succession-reason">${escapeHtml(s.reason || '')}</span>
     </div>
-  `).join('');
+  `).join(''));
 }
 
 // =============================================================================
@@ -1873,7 +1919,7 @@ function updateWavesAndAgents(data) {
   const container = document.getElementById('waves-container');
 
   if (!data.agents || Object.keys(data.agents).length === 0) {
-    container.innerHTML = '<p class="empty-state">No agents found</p>';
+    setHtml(container, '<p class="empty-state">No agents found</p>');
     return;
   }
 
@@ -1909,11 +1955,11 @@ function updateWavesAndAgents(data) {
   const sortedWaves = Object.entries(agentsByWave).sort((a, b) => parseInt(a[0]) - parseInt(b[0]));
 
   if (sortedWaves.length === 0) {
-    container.innerHTML = '<p class="empty-state">No waves found</p>';
+    setHtml(container, '<p class="empty-state">No waves found</p>');
     return;
   }
 
-  container.innerHTML = sortedWaves.map(([waveNum, waveData]) => {
+  setHtml(container, sortedWaves.map(([waveNum, waveData]) => {
     const waveStatus = waveData.completed ? 'completed' : (waveData.in_progress ? 'running' : 'pending');
 
     const agentsHtml = waveData.agents.map(agent => createAgentCardHtml(agent)).join('');
@@ -1929,17 +1975,7 @@ function updateWavesAndAgents(data) {
         </div>
       </div>
     `;
-  }).join('');
-
-  // Add click handlers to agent cards
-  document.querySelectorAll('.agent-card').forEach(card => {
-    card.addEventListener('click', (e) => {
-      const agentId = card.dataset.agentId;
-      if (agentId) {
-        selectAgent(agentId);
-      }
-    });
-  });
+  }).join(''));
 }
 
 // =============================================================================
@@ -2088,7 +2124,7 @@ function updateDetailPanel(agentId, agent) {
     `).join('');
   }
 
-  content.innerHTML = `
+  setHtml(content, `
     <div class="detail-section">
       <h3 class="detail-section-title">Status</h3>
       <div class="detail-info-grid">
@@ -2125,9 +2161,21 @@ function updateDetailPanel(agentId, agent) {
       <h3 class="detail-section-title">Live Activity Feed</h3>
       <div class="activity-feed">${activityHtml}</div>
     </div>
-  `;
+  `);
 }
 
+// =============================================================================
+// Agent Card Clicks
+// =============================================================================
+
+// Delegated once, so grid rewrites need no listener re-binding
+document.getElementById('waves-container').addEventListener('click', (e) => {
+  const card = e.target.closest('.agent-card');
+  if (card && card.dataset.agentId) {
+    selectAgent(card.dataset.agentId);
+  }
+});
+
 // =============================================================================
 // Keyboard Navigation
 // =============================================================================
@@ -2148,6 +2196,172 @@ setInterval(fetchStatus, 2000);
   </script>
 </html>'''
 
+_CSS_TOKEN_RE = re.compile(r'(--[\w-]+)\s*:\s*([^;]+);')
+_CSS_VAR_RE = re.compile(r'var\((--[\w-]+)\)')
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_CSS_BRACE_RE = re.compile(r'[{}]')
+_CSS_CLASS_RE = re.compile(r'\.([A-Za-z_][\w-]*)')
+_PAGE_WORD_RE = re.compile(r'[\w-]+')
+_CSS_SPACE_RE = re.compile(r'\s+')
+_CSS_PUNCT_RE = re.compile(r'\s*([{};,>])\s*|(:)\s+')
+_CSS_LEADING_ZERO_RE = re.compile(r'(?<![\w.])0(\.\d)')
+_CSS_HEX_RE = re.compile(r'#([0-9a-fA-F])\1([0-9a-fA-F])\2([0-9a-fA-F])\3(?![0-9a-fA-F])')
+_HTML_SCRIPT_RE = re.compile(r'(<script>.*?</script>)', re.DOTALL)
+_HTML_INDENT_RE = re.compile(r'\n\s+')
+
+# Class names that only arrive through status data, never literally in the page
+_CSS_SAFELIST = frozenset(('pending', 'running', 'completed', 'failed', 'idle'))
+
+
+def _purge_unused_css(css: str, used: frozenset) -> str:
+    """
+    Drop style rules whose selectors can never match the page.
+
+    A selector survives only if every class it names is in `used`; a rule
+    goes once none of its selectors survive. @media blocks are purged
+    recursively, other at-rules (@keyframes) and rules without classes
+    (:root, [data-theme]) are kept as they are. Comments are stripped.
+    """
+    css = _CSS_COMMENT_RE.sub('', css)
+    rules = []
+    depth = 0
+    start = brace = 0
+    for match in _CSS_BRACE_RE.finditer(css):
+        if match.group() == '{':
+            if depth == 0:
+                brace = match.start()
+            depth += 1
+            continue
+        depth -= 1
+        if depth:
+            continue
+
+        prelude = css[start:brace].strip()
+        body = css[brace + 1:match.start()]
+        start = match.end()
+        if prelude.startswith('@media'):
+            body = _purge_unused_css(body, used)
+            if body.strip():
+                rules.append('%s {\n%s}' % (prelude, body))
+        elif prelude.startswith('@'):
+            rules.append('%s {%s}' % (prelude, body))
+        else:
+            selectors = [
+                selector.strip() for selector in prelude.split(',')
+                if used.issuperset(_CSS_CLASS_RE.findall(selector))
+            ]
+            if selectors:
+                rules.append('%s {%s}' % (',\n'.join(selectors), body))
+    return '\n\n'.join(rules) + '\n'
+
+
+def _resolve_theme_css(css: str) -> Dict[str, str]:
+    """
+    Build a flat stylesheet per theme from the token-based source.
+
+    Every var(--*) in the rules is replaced with the theme's literal
+    value, so browsers skip custom property resolution when computing
+    styles. Each sheet keeps a :root block with its theme's tokens for
+    inline styles set from JavaScript.
+    """
+    root_start = css.index(':root {')
+    root_end = css.index('}', root_start) + 1
+    dark_start = css.index('[data-theme="dark"] {')
+    dark_end = css.index('}', dark_start) + 1
+
+    light = dict(_CSS_TOKEN_RE.findall(css[root_start:root_end]))
+    dark = {**light, **dict(_CSS_TOKEN_RE.findall(css[dark_start:dark_end]))}
+
+    sheets = {}
+    for theme, tokens in (('light', light), ('dark', dark)):
+        root = ':root {\n%s}' % ''.join(
+            '  %s: %s;\n' % item for item in tokens.items()
+        )
+        rules = css[root_end:dark_start] + css[dark_end:]
+        rules = _CSS_VAR_RE.sub(lambda m: tokens[m.group(1)], rules)
+        sheets[theme] = css[:root_start] + root + rules
+    return sheets
+
+
+# Every class the page markup and script can emit; anything else is dead CSS
+_PAGE_CLASSES = _CSS_SAFELIST.union(
+    _PAGE_WORD_RE.findall(_DASHBOARD_HTML_HEAD + _DASHBOARD_HTML_TAIL)
+)
+
+
+def _minify_css(css: str) -> str:
+    """
+    Minify a stylesheet with csscompressor, or with a small built-in pass
+    (comments, whitespace, leading zeros, six-digit hex colors) when it
+    is not installed.
+    """
+    if csscompressor is not None:
+        return csscompressor.compress(css)
+    css = _CSS_COMMENT_RE.sub('', css)
+    css = _CSS_SPACE_RE.sub(' ', css)
+    css = _CSS_PUNCT_RE.sub(lambda m: m.group(1) or m.group(2), css)
+    css = css.replace(';}', '}')
+    css = _CSS_LEADING_ZERO_RE.sub(r'\1', css)
+    return _CSS_HEX_RE.sub(r'#\1\2\3', css).strip()
+
+
+def _minify_html(html: str) -> str:
+    """
+    Minify the page with htmlmin, or drop line indentation outside the
+    inline script when it is not installed.
+    """
+    if htmlmin is not None:
+        return htmlmin.minify(
+            html,
+            remove_comments=True,
+            remove_empty_space=True,
+            reduce_boolean_attributes=True,
+        )
+    parts = _HTML_SCRIPT_RE.split(html)
+    parts[::2] = [_HTML_INDENT_RE.sub('\n', part) for part in parts[::2]]
+    return ''.join(parts)
+
+
+DASHBOARD_CSS_THEMES = _resolve_theme_css(_purge_unused_css(DASHBOARD_CSS, _PAGE_CLASSES))
+if not DEBUG:
+    DASHBOARD_CSS_THEMES = {
+        theme: _minify_css(sheet) for theme, sheet in DASHBOARD_CSS_THEMES.items()
+    }
+DASHBOARD_CSS_PATHS = {
+    theme: '/static/dashboard-%s.%s.css' % (
+        theme, hashlib.blake2b(sheet.encode('utf-8'), digest_size=4).hexdigest()
+    )
+    for theme, sheet in DASHBOARD_CSS_THEMES.items()
+}
+
+# The dark sheet starts disabled; the page script switches on theme changes
+DASHBOARD_HTML = (
+    _DASHBOARD_HTML_HEAD
+    + '  <link rel="stylesheet" id="theme-light" href="%s">\n' % DASHBOARD_CSS_PATHS['light']
+    + '  <link rel="stylesheet" id="theme-dark" href="%s" media="not all">\n' % DASHBOARD_CSS_PATHS['dark']
+    + _DASHBOARD_HTML_TAIL
+)
+if not DEBUG:
+    DASHBOARD_HTML = _minify_html(DASHBOARD_HTML)
+
+
+def _precompress(body: bytes) -> Tuple[bytes, bytes, Optional[bytes], str]:
+    """Return (raw, gzip, brotli or None, ETag) for a static response body."""
+    return (
+        body,
+        gzip.compress(body, 9),
+        brotli.compress(body, quality=11) if brotli else None,
+        '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest(),
+    )
+
+
+# Neither changes at runtime: encode, compress and tag them once
+DASHBOARD_HTML_ASSET = _precompress(DASHBOARD_HTML.encode('utf-8'))
+DASHBOARD_CSS_ASSETS = {
+    DASHBOARD_CSS_PATHS[theme]: _precompress(sheet.encode('utf-8'))
+    for theme, sheet in DASHBOARD_CSS_THEMES.items()
+}
+
 # =============================================================================
 # FilePositionTracker (from v6 - for incremental reads)
 # =============================================================================
@@ -2839,6 +3053,46 @@ class GASHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(html.encode('utf-8'))
 
+    def send_precompressed(
+        self,
+        content_type: str,
+        asset: Tuple[bytes, bytes, Optional[bytes], str],
+        cache_control: str
+    ):
+        """
+        Send a static asset built by _precompress, in the smallest encoding
+        the client's Accept-Encoding allows; a matching If-None-Match gets
+        a 304.
+        """
+        raw, gzipped, brotlied, etag = asset
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', cache_control)
+            self.send_cors_headers()
+            self.end_headers()
+            return
+
+        accept_encoding = self.headers.get('Accept-Encoding', '')
+        if brotlied is not None and 'br' in accept_encoding:
+            body, encoding = brotlied, 'br'
+        elif 'gzip' in accept_encoding:
+            body, encoding = gzipped, 'gzip'
+        else:
+            body, encoding = raw, None
+
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', len(body))
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Cache-Control', cache_control)
+        self.send_header('ETag', etag)
+        self.send_cors_headers()
+        self.end_headers()
+        self.wfile.write(body)
+
     def do_OPTIONS(self):
         """Handle OPTIONS request for CORS preflight."""
         self.send_response(200)
@@ -2852,7 +3106,16 @@ class GASHandler(BaseHTTPRequestHandler):
 
         try:
             if path == '/' or path == '/index.html':
-                self.send_html(DASHBOARD_HTML)
+                # Revalidate on each load; an unchanged page costs a 304
+                self.send_precompressed(
+                    'text/html; charset=utf-8', DASHBOARD_HTML_ASSET, 'no-cache'
+                )
+            elif path in DASHBOARD_CSS_ASSETS:
+                # The URL changes with the content, so it can be cached forever
+                self.send_precompressed(
+                    'text/css; charset=utf-8', DASHBOARD_CSS_ASSETS[path],
+                    'public, max-age=31536000, immutable'
+                )
             elif path == '/api/status':
                 self.send_json(get_gas_status())
             elif path.startswith('/api/agent/'):
@@ -441,7 +441,7 @@ def generate_swarm_report(gas_dir: Path) -> str:
     agents = state.get("agents", {})
     total_generations = sum(a.get("total_generations", 0) for a in agents.values())
     
-    report = f"""
+    parts = [f"""
 ================================================================================
                        GAS SWARM COMPLETION REPORT
 ================================================================================
@@ -453,18 +453,18 @@ Started: {state.get('start_time', 'Unknown')}
 --------------------------------------------------------------------------------
 AGENT SUMMARY
 --------------------------------------------------------------------------------
-"""
+"""]
     
     for agent_id, agent in agents.items():
-        report += f"""
+        parts.append(f"""
 Agent: {agent_id}
   Role: {agent.get('role', 'Unknown')}
   Wave: {agent.get('wave', 0)}
   Generations: {agent.get('total_generations', 0)}
   Status: {agent.get('status', 'Unknown')}
-"""
+""")
     
-    report += f"""
+    parts.append(f"""
 --------------------------------------------------------------------------------
 KNOWLEDGE ACCUMULATED
 --------------------------------------------------------------------------------
@@ -474,7 +474,8 @@ Domain Insights: {len(knowledge.get('domain_knowledge', [])) if knowledge else 0
 Total Generations: {total_generations}
 
 ================================================================================
-"""
+""")
+    report = ''.join(parts)
     
     report_path = gas_dir / "SWARM_REPORT.md"
     with open(report_path, 'w') as f: